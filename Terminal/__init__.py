@@ -2,24 +2,46 @@
 The Terminal provides all features you will ever need when building your CLI applications.
 """
 
-from typing import Tuple, Optional, Literal, Union
+from typing import Iterable, Tuple, Optional, Literal, Union
 
-from . import core
-from ._internal import (
-    Utils, 
-    AnsiColor, 
-    AnsiCursor, 
-    Builder, 
-    FileSystem, 
-    Terminal, 
-    Mode, 
-    Pages
-)
-from ._internal.core import History, Manager, ClearScreenArg
-from . import ansi, builder, pages, files, tools
+from ._internal.core import Terminal, History, Manager, ClearScreenArg
+from ._internal.enums import Mode, ColorLevel
+import importlib
 import sys
 
-class Module:
+class LazyModule(type):
+    # Name -> (module, attribute). Only the core is imported with the package, the rest on first access
+    lazy = {
+        "Builder": ("._internal.builder", "Builder"),
+        "FileSystem": ("._internal.files", "FileSystem"),
+        "Utils": ("._internal.tools", "Utils"),
+        "AnsiColor": ("._internal.tools", "AnsiColor"),
+        "AnsiCursor": ("._internal.tools", "AnsiCursor"),
+        "TaskRunner": ("._internal.tools", "TaskRunner"),
+        "Colorize": ("._internal.tools", "Colorize"),
+        "Pages": ("._internal.pages", "Public"),
+        "pages": (".pages", None),
+        "ansi": (".ansi", None),
+        "core": (".core", None),
+        "files": (".files", None),
+        "builder": (".builder", None),
+        "tools": (".tools", None),
+    }
+
+    def __getattr__(cls, name: str):
+        if name not in cls.lazy:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        module, attribute = cls.lazy[name]
+        value = importlib.import_module(module, __name__)
+        if attribute is not None:
+            value = getattr(value, attribute)
+        setattr(cls, name, value)
+        return value
+
+    def __dir__(cls):
+        return sorted(set(super().__dir__()) | set(cls.lazy))
+
+class Module(metaclass=LazyModule):
     @staticmethod
     def terminal_init() -> None:
         Terminal.init()
@@ -72,6 +94,61 @@ class Module:
             n=n
         )
     
+    @staticmethod
+    async def ainput(
+        *prompt: object,
+        sep: Optional[str] = " ",
+        end: Optional[str] = "",
+        flush: bool = False,
+        color: bool = False,
+        clear_screen: ClearScreenArg = False,
+        input_text: Optional[str] = "",
+        n: int = -1
+    ) -> str:
+        return await Terminal.ainput(
+            *prompt, 
+            sep=sep, 
+            end=end, 
+            flush=flush, 
+            color=color, 
+            clear_screen=clear_screen, 
+            input_text=input_text, 
+            n=n
+        )
+    
+    @staticmethod
+    def print_stream(
+        lines: Iterable[object], 
+        *, 
+        end: Optional[str] = "\n", 
+        flush: bool = True, 
+        color: bool = False, 
+        chunk_size: int = 1 << 16
+    ) -> None:
+        Terminal.print_stream(lines, end=end, flush=flush, color=color, chunk_size=chunk_size)
+    
+    @staticmethod
+    async def aprint(
+        *values: object,
+        sep: Optional[str] = " ",
+        end: Optional[str] = "\n",
+        flush: bool = False,
+        color: bool = False,
+        clear_screen: ClearScreenArg = False,
+        prefix: str = "",
+        suffix: str = "",
+    ) -> None: 
+        await Terminal.aprint(
+            *values, 
+            sep=sep, 
+            end=end, 
+            flush=flush, 
+            color=color, 
+            clear_screen=clear_screen, 
+            prefix=prefix,
+            suffix=suffix
+        )
+    
     def space() -> None:
         Terminal.space()
     
@@ -124,29 +201,30 @@ class Module:
         return Terminal.get_size()
 
     Mode = Mode
+    ColorLevel = ColorLevel
     Terminal = Terminal
     Simple = Terminal.Simple
     History = History
-    Builder = Builder
-    FileSystem = FileSystem
-    Utils = Utils
-    AnsiColor = AnsiColor
-    AnsiCursor = AnsiCursor
-    Pages = Pages
     manager = Terminal.manager
 
+    Template = Terminal.Template
     IOString = Terminal.IOString
     AnimatedString = Terminal.AnimatedString
     ProgressBar = Terminal.ProgressBar
 
-    pages = pages
-    ansi = ansi
-    core = core
-    files = files
-    builder = builder
-    tools = tools
+    # Submodules are found through the package path, as they would be on a plain module
+    __path__ = __path__
+    __spec__ = __spec__
+    __file__ = __file__
+    __all__ = (
+        "terminal_init", "terminal_deinit", "print", "print_stream", "input", "ainput", "aprint", "space", "clear", "lookup", "log", 
+        "new_env", "set_env_mode", "progress_bar", "strip_ansi", "remove_tags", "get_size", 
+        "Mode", "ColorLevel", "Terminal", "Simple", "History", "Builder", "FileSystem", "Utils", "AnsiColor", "AnsiCursor", 
+        "TaskRunner", "Colorize", "Pages", "manager", "Template", "IOString", "AnimatedString", "ProgressBar", 
+        "pages", "ansi", "core", "files", "builder", "tools"
+    )
 
-    terminal_init()
+    # The terminal is initiated by the first output rather than on import, see Terminal.start
 
     @classmethod
     def get_module(cls):
@@ -1,17 +1,21 @@
-from typing import Tuple, Type, Optional, Union, Literal, overload
+from typing import Iterable, Tuple, Type, Optional, Union, Literal, overload
 from ._internal import (
     Utils as _Utils, 
     AnsiColor as _AnsiColor,
     AnsiCursor as _AnsiCursor,
+    TaskRunner as _TaskRunner,
+    Colorize as _Colorize,
     Builder as _Builder, 
     FileSystem as _FileSystem, 
     Terminal as _Terminal, 
     Mode as _Mode,
+    ColorLevel as _ColorLevel,
     Pages as _Pages
 )
 from ._internal.core import History as _History, Manager, ClearScreenArg
 
 Mode: Type[_Mode]
+ColorLevel: Type[_ColorLevel]
 Terminal: Type[_Terminal]
 Simple: Type[_Terminal.Simple]
 History: Type[_History]
@@ -20,10 +24,13 @@ FileSystem: Type[_FileSystem]
 Utils: Type[_Utils]
 AnsiColor: Type[_AnsiColor]
 AnsiCursor: Type[_AnsiCursor]
+TaskRunner: Type[_TaskRunner]
+Colorize: Type[_Colorize]
 Pages: Type[_Pages]
 
 manager: Manager
 
+Template: Type[_Terminal.Template]
 IOString: Type[_Terminal.IOString]
 AnimatedString: Type[_Terminal.AnimatedString]
 ProgressBar: Type[_Terminal.ProgressBar]
@@ -46,6 +53,15 @@ def print(
     suffix: str = "",
 ) -> None: ...
 
+def print_stream(
+    lines: Iterable[object], 
+    *, 
+    end: Optional[str] = "\n", 
+    flush: bool = True, 
+    color: bool = False, 
+    chunk_size: int = 1 << 16
+) -> None: ...
+
 def input(
     *prompt: object,
     sep: Optional[str] = " ",
@@ -57,6 +73,28 @@ def input(
     n: int = -1
 ) -> str: ...
 
+async def ainput(
+    *prompt: object,
+    sep: Optional[str] = " ",
+    end: Optional[str] = "",
+    flush: bool = False,
+    color: bool = False,
+    clear_screen: ClearScreenArg = False,
+    input_text: Optional[str] = "",
+    n: int = -1
+) -> str: ...
+
+async def aprint(
+    *values: object,
+    sep: Optional[str] = " ",
+    end: Optional[str] = "\n",
+    flush: bool = False,
+    color: bool = False,
+    clear_screen: ClearScreenArg = False,
+    prefix: str = "",
+    suffix: str = "",
+) -> None: ...
+
 def space() -> None: ...
 
 @overload
@@ -2,20 +2,44 @@
 The internal aren't supposed to be accessed publicaly.
 """
 
-from .tools import Utils, AnsiColor, AnsiCursor
-from .builder import Builder
-from .files import FileSystem
-from .core import Terminal
-from .enums import Mode
-from .pages import Public as Pages
+import importlib
 
 __all__ = (
     "Utils",
     "AnsiColor",
     "AnsiCursor",
+    "TaskRunner",
+    "Colorize",
     "Builder",
     "FileSystem",
     "Terminal", 
     "Mode",
+    "ColorLevel",
     "Pages",
-)
\ No newline at end of file
+)
+
+# Name -> (submodule, attribute). Submodules are imported on first access, not with the package
+_lazy = {
+    "Utils": (".tools", "Utils"),
+    "AnsiColor": (".tools", "AnsiColor"),
+    "AnsiCursor": (".tools", "AnsiCursor"),
+    "TaskRunner": (".tools", "TaskRunner"),
+    "Colorize": (".tools", "Colorize"),
+    "Builder": (".builder", "Builder"),
+    "FileSystem": (".files", "FileSystem"),
+    "Terminal": (".core", "Terminal"),
+    "Mode": (".enums", "Mode"),
+    "ColorLevel": (".enums", "ColorLevel"),
+    "Pages": (".pages", "Public"),
+}
+
+def __getattr__(name: str):
+    if name not in _lazy:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attribute = _lazy[name]
+    value = getattr(importlib.import_module(module, __name__), attribute)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,7 +1,12 @@
-from typing import Iterable, Tuple, List, Optional, Callable, Literal, Union, TypeVar, Any
-from .enums import Mode
+from typing import Iterable, Tuple, List, Dict, Optional, Callable, Literal, Union, TypeVar, Any
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from .enums import Mode, ColorLevel
+from .sgr import Fore, Back, Style, supports_vt, detect_level, rgb
 import datetime
-import colorama
+import threading
+import queue
+import time
 import signal
 import atexit
 import sys
@@ -10,6 +15,8 @@ import re
 
 __all__ = (
     "History", 
+    "Output", 
+    "LogSink", 
     "ClearScreenArg", 
     "Manager", 
     "Terminal", 
@@ -21,16 +28,335 @@ ClearScreenArg = Union[bool, Tuple[bool, bool], Tuple[bool, bool, bool]]
 class Config:
     class LOGGING:
         LOG_FILE_PATH = None
+        MAX_BYTES = 0 # Rotate once the file would grow past this size. 0 disables it
+        ROTATE_INTERVAL = 0 # Rotate after this many seconds. 0 disables it
+        BACKUP_COUNT = 3
+        BATCH_SIZE = 256
         COLORS = {
             "ERROR": "$red",
             "WARN": "$yel",
             "INFO": "$blu"
         }
+    class FORMATTING:
+        CACHE_SIZE = 256
+        CACHE_MAX_LENGTH = 256 # Longer texts are rendered without being cached
+        COLOR_CACHE_SIZE = 4096 # Interned rgb colors
+    class HISTORY:
+        ENABLED = True
+        FORMATTINGS = 1000
+        INPUTS = 1000
+    class OUTPUT:
+        BUFFERED = False
+        BUFFER_SIZE = 8192
+        FLUSH_INTERVAL = 0.05
+        CONCURRENT = False
+        BATCH_SIZE = 512
+        BACKEND = "auto" # "native" writes straight to the stream, "colorama" through its wrapper, "auto" picks
+        COLOR_LEVEL: Optional[ColorLevel] = None # Detected from the environment unless set
     AUTO_DEINIT = True
 
 class History: 
-    formattings = []
-    inputs = []
+    formattings = deque(maxlen=Config.HISTORY.FORMATTINGS)
+    inputs = deque(maxlen=Config.HISTORY.INPUTS)
+
+    @classmethod
+    def resize(cls) -> None:
+        # Keeps the newest entries that still fit the new capacities
+        cls.formattings = deque(cls.formattings, maxlen=Config.HISTORY.FORMATTINGS)
+        cls.inputs = deque(cls.inputs, maxlen=Config.HISTORY.INPUTS)
+    
+    @classmethod
+    def clear(cls) -> None:
+        cls.formattings.clear()
+        cls.inputs.clear()
+    
+    @classmethod
+    def stats(cls) -> Dict[str, Dict[str, Optional[int]]]:
+        return {
+            name: {
+                "entries": len(entries),
+                "capacity": entries.maxlen,
+                "bytes": sys.getsizeof(entries) + sum(map(sys.getsizeof, entries)),
+            }
+            for name, entries in (("formattings", cls.formattings), ("inputs", cls.inputs))
+        }
+
+class Output:
+    class Batch(threading.local):
+        # Every thread batches its own writes, nested batches share the outermost one
+        depth = 0
+        size = 0
+        since = 0.0
+
+        def __init__(self) -> None:
+            self.buffer = []
+
+    target = None # Replaces stdout while set, e.g. by a renderer capturing a frame
+    reads = 0 # Inputs read so far, lets a render loop tell whether a page consumed input
+    strip = False # Set without color on the native backend, which leaves nothing else to remove raw sequences
+    _buffer = []
+    _size = 0
+    _since = 0.0
+    _batch = Batch()
+    _lock = threading.RLock()
+    _queue = None
+    _writer = None
+    _error = None # Left by the writer thread for the next flush
+    _timer = None
+
+    @classmethod
+    def stream(cls) -> Any:
+        return sys.stdout if cls.target is None else cls.target
+    
+    @classmethod
+    def buffering(cls) -> bool:
+        return Config.OUTPUT.BUFFERED or Config.OUTPUT.CONCURRENT or cls._batch.depth > 0
+    
+    @classmethod
+    def write(cls, text: str, flush: bool = False) -> None:
+        if not Terminal._started or Terminal._signal_pending:
+            Terminal.start()
+        if cls.strip:
+            text = Terminal.strip_ansi(text) # Also colors built from raw sequences, e.g. `Fore`, or environment colors
+        if Config.OUTPUT.CONCURRENT:
+            cls._records().put(text) # Every record is written whole by the writer thread
+            if flush:
+                cls.flush()
+            return
+        batch = cls._batch
+        if batch.depth:
+            now = time.monotonic()
+            if not batch.buffer:
+                batch.since = now
+            batch.buffer.append(text)
+            batch.size += len(text)
+            if flush or batch.size >= Config.OUTPUT.BUFFER_SIZE or now - batch.since >= Config.OUTPUT.FLUSH_INTERVAL:
+                cls.flush()
+            return
+        if not cls.buffering():
+            stream = cls.stream()
+            stream.write(text)
+            if flush:
+                stream.flush()
+            return
+        with cls._lock:
+            now = time.monotonic()
+            if not cls._buffer:
+                cls._since = now
+                if Config.OUTPUT.BUFFERED and cls._timer is None:
+                    # Nothing else may write for a while, so the interval is also kept by a timer
+                    cls._timer = threading.Timer(Config.OUTPUT.FLUSH_INTERVAL, cls._flush_due)
+                    cls._timer.daemon = True
+                    cls._timer.start()
+            cls._buffer.append(text)
+            cls._size += len(text)
+            if flush or cls._size >= Config.OUTPUT.BUFFER_SIZE or now - cls._since >= Config.OUTPUT.FLUSH_INTERVAL:
+                cls.flush()
+    
+    @classmethod
+    def flush(cls) -> None:
+        records = cls._queue
+        if records is not None:
+            records.join()
+            error, cls._error = cls._error, None
+            if error is not None:
+                raise error
+        with cls._lock:
+            if cls._timer is not None:
+                cls._timer.cancel()
+                cls._timer = None
+            stream = cls.stream()
+            batch = cls._batch # Only the calling thread's, the others are still collecting
+            text = "".join(cls._buffer) + "".join(batch.buffer)
+            cls._buffer = []
+            cls._size = 0
+            batch.buffer = []
+            batch.size = 0
+            if text:
+                stream.write(text)
+            stream.flush()
+    
+    @classmethod
+    def _flush_due(cls) -> None:
+        with cls._lock:
+            if cls._timer is not threading.current_thread():
+                return # Flushed and possibly rearmed in the meantime
+            cls._timer = None
+        cls.flush()
+    
+    @classmethod
+    def stop(cls) -> None:
+        with cls._lock:
+            writer, records = cls._writer, cls._queue
+            cls._writer = cls._queue = None
+        if writer is None: return
+        records.put(None)
+        writer.join()
+    
+    @classmethod
+    def _records(cls) -> "queue.Queue[Optional[str]]":
+        records = cls._queue
+        if records is not None:
+            return records
+        with cls._lock:
+            if cls._queue is None:
+                cls._queue = queue.Queue()
+                cls._writer = threading.Thread(target=cls._drain, args=(cls._queue,), name="Terminal.Output", daemon=True)
+                cls._writer.start()
+            return cls._queue
+    
+    @classmethod
+    def _drain(cls, records: "queue.Queue[Optional[str]]") -> None:
+        running = True
+        while running:
+            batch = [records.get()]
+            while len(batch) < Config.OUTPUT.BATCH_SIZE:
+                try:
+                    batch.append(records.get_nowait())
+                except queue.Empty:
+                    break
+            running = None not in batch
+            text = "".join(record for record in batch if record is not None)
+            try:
+                if text:
+                    with cls._lock:
+                        stream = cls.stream()
+                        stream.write(text)
+                        stream.flush()
+            except BrokenPipeError:
+                Terminal._discard_stdout()
+            except Exception as error:
+                cls._error = error # Raised again by the next flush, on the caller's thread
+            finally:
+                for _ in batch:
+                    records.task_done()
+    
+    @classmethod
+    def echo(cls, text: str) -> None:
+        # Tells the target what the terminal itself echoed while reading input
+        cls.reads += 1
+        echo = getattr(cls.target, "echo", None)
+        if echo is not None:
+            echo(text)
+    
+    @classmethod
+    @contextmanager
+    def batch(cls):
+        batch = cls._batch
+        batch.depth += 1
+        try:
+            yield
+        finally:
+            batch.depth -= 1
+            if not batch.depth:
+                text = "".join(batch.buffer)
+                batch.buffer = []
+                batch.size = 0
+                if text:
+                    cls.write(text) # Into the global buffer while buffered, straight out otherwise
+                if not cls.buffering():
+                    cls.flush()
+
+class LogSink:
+    _queue = None
+    _thread = None
+    _error = None # Left by the writer thread for the next emit or flush
+    _lock = threading.Lock()
+
+    @classmethod
+    def emit(cls, text: str) -> None:
+        with cls._lock:
+            cls._raise()
+            if cls._thread is None:
+                path = Config.LOGGING.LOG_FILE_PATH
+                file = open(path, "ab") # Opened here, so a bad path fails on the caller's thread
+                cls._queue = queue.Queue()
+                cls._thread = threading.Thread(
+                    target=cls._run, 
+                    args=(cls._queue, path, file), 
+                    name="Terminal.LogSink", 
+                    daemon=True
+                )
+                cls._thread.start()
+            cls._queue.put(text)
+    
+    @classmethod
+    def flush(cls) -> None:
+        records = cls._queue
+        if records is not None:
+            records.join()
+        cls._raise()
+    
+    @classmethod
+    def _raise(cls) -> None:
+        error, cls._error = cls._error, None
+        if error is not None:
+            raise error
+    
+    @classmethod
+    def close(cls) -> None:
+        with cls._lock:
+            thread, records = cls._thread, cls._queue
+            cls._thread = cls._queue = None
+        if thread is None: return
+        records.put(None)
+        thread.join()
+    
+    @classmethod
+    def _run(cls, records: "queue.Queue[Optional[str]]", path: str, file: Any) -> None:
+        tags = re.compile(Terminal.pattern)
+        size = file.tell()
+        opened = time.monotonic()
+        running = True
+        while running:
+            batch = [records.get()]
+            while len(batch) < Config.LOGGING.BATCH_SIZE:
+                try:
+                    batch.append(records.get_nowait())
+                except queue.Empty:
+                    break
+            running = None not in batch
+            try:
+                data = "".join(
+                    Terminal.strip_ansi(tags.sub("", record)) + "\n" for record in batch if record is not None
+                ).encode()
+                if data:
+                    if size and cls._should_rotate(size + len(data), opened):
+                        file.close()
+                        try:
+                            cls._rotate(path)
+                        except OSError as error:
+                            cls._error = error # Reported, but the records still go to the current file
+                        file = open(path, "ab")
+                        size = file.tell()
+                        opened = time.monotonic()
+                    file.write(data)
+                    file.flush()
+                    size += len(data)
+            except Exception as error:
+                cls._error = error # Raised again by the next emit or flush, on the caller's thread
+            finally:
+                for _ in batch:
+                    records.task_done()
+        file.close()
+    
+    @staticmethod
+    def _should_rotate(size: int, opened: float) -> bool:
+        if Config.LOGGING.MAX_BYTES and size > Config.LOGGING.MAX_BYTES:
+            return True
+        return bool(Config.LOGGING.ROTATE_INTERVAL) and time.monotonic() - opened >= Config.LOGGING.ROTATE_INTERVAL
+    
+    @staticmethod
+    def _rotate(path: str) -> None:
+        count = Config.LOGGING.BACKUP_COUNT
+        if count <= 0:
+            open(path, "wb").close()
+            return
+        for i in range(count - 1, 0, -1):
+            if os.path.exists(f"{path}.{i}"):
+                os.replace(f"{path}.{i}", f"{path}.{i + 1}")
+        if os.path.exists(path):
+            os.replace(path, f"{path}.1")
 
 class Manager:
     class Environment:
@@ -52,7 +378,7 @@ class Manager:
             
             @property
             def formatted(self) -> List[str]:
-                return self._env.formatted[:]
+                return list(self._env.formatted)
             
             def format(self, text: str) -> str:
                 return self._env.format(text)
@@ -70,10 +396,38 @@ class Manager:
             suffix: Optional["Terminal.Color"] = None
         ) -> None:
             self.manager = manager
-            self.prefix_color = prefix
-            self.suffix_color = suffix
-            self.active = False
-            self.formatted = []
+            self._prefix_color = prefix
+            self._suffix_color = suffix
+            self._active = False
+            self.formatted = deque(maxlen=Config.HISTORY.FORMATTINGS)
+        
+        @property
+        def active(self) -> bool:
+            return self._active
+        
+        @active.setter
+        def active(self, active: bool) -> None:
+            with self.manager.lock:
+                self._active = active
+                self.manager.rebuild()
+        
+        @property
+        def prefix_color(self) -> Optional["Terminal.Color"]:
+            return self._prefix_color
+        
+        @prefix_color.setter
+        def prefix_color(self, color: Optional["Terminal.Color"]) -> None:
+            self._prefix_color = color
+            self.manager.invalidate()
+        
+        @property
+        def suffix_color(self) -> Optional["Terminal.Color"]:
+            return self._suffix_color
+        
+        @suffix_color.setter
+        def suffix_color(self, color: Optional["Terminal.Color"]) -> None:
+            self._suffix_color = color
+            self.manager.invalidate()
         
         @property
         def prefix(self) -> str:
@@ -84,15 +438,17 @@ class Manager:
             return self.suffix_color.ansi if self.suffix_color else ""
         
         def enable(self) -> GlobalInterface:
-            if not self in self.manager.env_stack:
-                self.manager.env_stack.append(self)
-            self.active = True
+            with self.manager.lock:
+                if not self in self.manager.env_stack:
+                    self.manager.env_stack.append(self)
+                self.active = True
             return self.GlobalInterface(self)
         
         def disable(self) -> None:
-            if self in self.manager.env_stack:
-                self.manager.env_stack.remove(self)
-            self.active = False
+            with self.manager.lock:
+                if self in self.manager.env_stack:
+                    self.manager.env_stack.remove(self)
+                self.active = False
         
         def __enter__(self) -> GlobalInterface:
             return self.enable()
@@ -100,45 +456,73 @@ class Manager:
         def __exit__(self, *args) -> None:
             self.disable()
         
-        def format(self, text: str) -> str:
-            self.formatted.append(text)
+        def format(self, text: str, record: bool = True) -> str:
+            if record and Config.HISTORY.ENABLED:
+                self.formatted.append(text)
             return self.prefix + text + self.suffix
         
         def reset(self) -> None:
-            self.formatted = []
+            self.formatted = deque(maxlen=Config.HISTORY.FORMATTINGS)
             self.active = False
 
     def __init__(self) -> None:
         self.env_stack = []
         self.mode = Mode.SINGLE
+        self.lock = threading.RLock()
+        self.chain: Tuple[Manager.Environment, ...] = () # The active environments, in stack order
+        self._composite: Optional[Tuple[Tuple[Manager.Environment, ...], str, str]] = None
     
     @property
     def active(self) -> bool:
-        return any(env.active for env in self.env_stack)
+        return bool(self.chain)
+    
+    def rebuild(self) -> None:
+        with self.lock:
+            self.chain = tuple(env for env in self.env_stack if env._active)
+            self._composite = None
+    
+    def invalidate(self) -> None:
+        self._composite = None
+    
+    def composite(self, chain: Optional[Tuple[Environment, ...]] = None) -> Tuple[str, str]:
+        chain = self.chain if chain is None else chain
+        cached = self._composite
+        if cached is None or cached[0] is not chain: # Stale when computed for another chain
+            # Each environment wraps the text of the ones before it
+            cached = (
+                chain, 
+                "".join(env.prefix for env in reversed(chain)), 
+                "".join(env.suffix for env in chain)
+            )
+            self._composite = cached
+        return cached[1], cached[2]
     
     def disable(self) -> None:
-        while self.env_stack:
-            env = self.env_stack.pop()
-            env.active = False
+        with self.lock:
+            while self.env_stack:
+                env = self.env_stack.pop()
+                env._active = False
+            self.rebuild()
     
-    def format(self, text: str) -> str:
-        if not self.active:
+    def format(self, text: str, record: bool = True) -> str:
+        chain = self.chain # Replaced, never mutated, so other threads may enable or disable environments meanwhile
+        if not chain:
             return text
         match self.mode:
             case Mode.SINGLE:
-                for env in reversed(self.env_stack):
-                    if env.active:
-                        text = env.format(text)
-                        break
+                text = chain[-1].format(text, record)
             case Mode.MULTIPLE:
-                for env in self.env_stack:
-                    if not env.active: continue
-                    text = env.format(text)
+                if record and Config.HISTORY.ENABLED:
+                    for env in chain:
+                        env.formatted.append(text)
+                prefix, suffix = self.composite(chain)
+                text = prefix + text + suffix
         return text
     
     def new_env(self, prefix: Optional["Terminal.Color"] = None, suffix: Optional["Terminal.Color"] = None) -> Environment:
         env = self.Environment(self, prefix, suffix)
-        self.env_stack.append(env)
+        with self.lock:
+            self.env_stack.append(env)
         return env
 
 class Terminal:
@@ -146,8 +530,33 @@ class Terminal:
     manager = Manager()
     pattern = r"(\$[a-z]{3})"
     blocking = False # Enable blocking to allow the system to run, but never print anything onto screen
+    Fore = Fore
+    Back = Back
+    Style = Style
+    _color_keys = (
+        ("$bla", Fore.BLACK),
+        ("$blu", Fore.BLUE),
+        ("$cya", Fore.CYAN),
+        ("$gre", Fore.GREEN),
+        ("$mag", Fore.MAGENTA),
+        ("$red", Fore.RED),
+        ("$whi", Fore.WHITE),
+        ("$yel", Fore.YELLOW),
+        ("$bri", Style.BRIGHT),
+        ("$dim", Style.DIM),
+        ("$res", Style.RESET_ALL)
+    )
+    backend: Optional[str] = None # The backend in use, chosen on init
+    color_level: Optional[ColorLevel] = None # Detected on first use and again on init
     _initialized = False
+    _started = False # Set by the first output, which installs the exit and interrupt handling
+    _signal_pending = False # Still to be installed, when the first output came from another thread
+    _start_lock = threading.RLock()
     _regex = None
+    _templates = OrderedDict()
+    _templates_lock = threading.Lock()
+    _sightings = set()
+    _colors_version = 0
 
     _ansi_escape = re.compile(r'\x1b\[[0-9;]*m')
 
@@ -174,9 +583,31 @@ class Terminal:
             os.system("cls" if os.name == "nt" else "clear")
     
     class Color:
+        __slots__ = ("ansi", "tag")
+        _interned: Dict[Tuple[Any, ...], "Terminal.Color"] = {}
+
         def __init__(self, *ansi: str, tag: Optional[str] = None) -> None:
-            self.ansi = "".join(ansi)
-            self.tag = tag
+            object.__setattr__(self, "ansi", "".join(ansi))
+            object.__setattr__(self, "tag", tag)
+
+        def __setattr__(self, name: str, value: Any) -> None:
+            raise AttributeError(f"{type(self).__name__} is immutable")
+
+        def __delattr__(self, name: str) -> None:
+            raise AttributeError(f"{type(self).__name__} is immutable")
+
+        def __copy__(self) -> "Terminal.Color":
+            return self # Immutable, so a copy may as well be the same object
+
+        def __deepcopy__(self, memo: Dict[int, Any]) -> "Terminal.Color":
+            return self
+
+        def __reduce__(self) -> Tuple[Any, ...]:
+            # The tag is restored by __setstate__, as __setattr__ refuses it
+            return type(self), (self.ansi,), self.tag
+
+        def __setstate__(self, tag: Optional[str]) -> None:
+            object.__setattr__(self, "tag", tag)
 
         @classmethod
         def lookup(cls, tag: str) -> Optional["Terminal.Color"]:
@@ -184,11 +615,22 @@ class Terminal:
         
         @classmethod
         def rgb(cls, r: int, g: int, b: int) -> "Terminal.Color":
-            return cls(f"\033[38;2;{r};{g};{b}m")
+            return cls._intern(r, g, b, False)
         
         @classmethod
         def bg_rgb(cls, r: int, g: int, b: int) -> "Terminal.Color":
-            return cls(f"\033[48;2;{r};{g};{b}m")
+            return cls._intern(r, g, b, True)
+        
+        @classmethod
+        def _intern(cls, r: int, g: int, b: int, background: bool) -> "Terminal.Color":
+            # The same rgb at the same color level is always the same object
+            key = (cls, r, g, b, background, Terminal.level())
+            color = cls._interned.get(key)
+            if color is None:
+                if len(cls._interned) >= Config.FORMATTING.COLOR_CACHE_SIZE:
+                    cls._interned.clear()
+                color = cls._interned.setdefault(key, cls(rgb(r, g, b, key[5], background)))
+            return color
         
         def paint(self, text: str) -> str:
             return self.ansi + text
@@ -231,6 +673,9 @@ class Terminal:
                 return self.ansi == other
             return NotImplemented
 
+        def __hash__(self) -> int:
+            return hash(self.ansi) # Equal to its ansi string, so it hashes like it
+
         def __add__(
             self, other: Union[str, "Terminal.Color", Iterable[Union[str, "Terminal.Color"]]]
         ) -> "Terminal.Color":
@@ -260,6 +705,36 @@ class Terminal:
                 return cls(value)
             raise KeyError(f"Invalid mode {mode!r} for Color lookup")
     
+    class Template:
+        def __init__(self, source: str) -> None:
+            self.source = source
+            self.segments = ()
+            self.value = ""
+            self.version = -1
+            self.compile()
+        
+        def compile(self) -> None:
+            if not Terminal._regex:
+                Terminal.regex_init()
+            # Splitting on the capturing pattern alternates literals (even) and tags (odd)
+            parts = Terminal._regex.split(self.source)
+            keys = Terminal.ColorKeys
+            parts[1::2] = [keys.get(tag, tag) for tag in parts[1::2]]
+            self.segments = tuple(filter(None, parts))
+            self.value = "".join(map(str, self.segments))
+            self.version = Terminal._colors_version
+        
+        def render(self, prefix: str = "", suffix: str = "") -> str:
+            if self.version != Terminal._colors_version:
+                self.compile()
+            return prefix + self.value + suffix
+        
+        def __str__(self) -> str:
+            return self.render()
+        
+        def __repr__(self) -> str:
+            return f"Terminal.Template({self.source!r})"
+    
     class IOString: 
         def __init__(self, value: str = "") -> None:
             self.value = value
@@ -367,89 +842,228 @@ class Terminal:
             self.frames[self.index] = ""
 
     class ProgressBar(AnimatedString):
-        def __init__(self, formatted_string: str, token: str, length: int) -> None:
+        _placeholders = re.compile(r"(\[has\]|\[need\]|\[prog\])")
+
+        class Frames:
+            def __init__(self, bar: "Terminal.ProgressBar") -> None:
+                self.bar = bar
+                self.overrides = {}
+            
+            def __len__(self) -> int:
+                return self.bar.length + 1
+            
+            def __getitem__(self, index: int) -> str:
+                if index < 0:
+                    index += len(self)
+                if not 0 <= index < len(self):
+                    raise IndexError("Progress bar frame out of range")
+                if index in self.overrides:
+                    return self.overrides[index]
+                return self.bar.render(index, self.bar.length)
+            
+            def __setitem__(self, index: int, value: str) -> None:
+                self.overrides[index % len(self)] = value
+            
+            def __iter__(self) -> Iterable[str]:
+                return (self[i] for i in range(len(self)))
+
+        def __init__(self, formatted_string: str, token: str, length: int, empty: Optional[str] = None) -> None:
             super().__init__(["[Progress bar] An error has likely occured. Please review the code once again."])
             self.formatted_string = formatted_string
             self.token = token
+            self.empty = empty
             self.length = length
             self.generate()
         
         def generate(self) -> None:
-            self.frames = [
-                Terminal.progress_bar(self.formatted_string, self.token, self.length, i, self.length)
-                for i in range(self.length + 1)
-            ]
+            # Format once and split around the placeholders, so frames only need a join
+            self.parts = self._placeholders.split(Terminal.format(self.formatted_string, color=True))
+            self.frames = self.Frames(self)
+            self.cells = -1
+            self.percent = -1
         
         def calc_index(self, has: int, need: int) -> int:
             return int((has/need) * self.length)
+        
+        def render(self, has: float, need: float) -> str:
+            factor = has / need if need else 0
+            return self._render(int(self.length * factor), int(factor * 100))
+        
+        def update(self, has: float, need: float, *, flush: bool = True) -> bool:
+            factor = has / need if need else 0
+            cells = int(self.length * factor)
+            percent = int(factor * 100)
+            if cells == self.cells and percent == self.percent:
+                return False
+            self.cells = cells
+            self.percent = percent
+            self.index = max(0, min(cells, self.length))
+            if not Terminal.blocking:
+                Output.write("\r" + self._render(cells, percent) + "\033[K", flush=flush and not Output.buffering())
+            return True
+        
+        def _render(self, cells: int, percent: int) -> str:
+            empty = self.token if self.empty is None else self.empty
+            values = {"[has]": self.token * cells, "[need]": empty * (self.length - cells), "[prog]": str(percent)}
+            return "".join(values.get(part, part) if i % 2 else part for i, part in enumerate(self.parts))
     
     @classmethod
-    def configure(cls, *, mode: Union[Mode, Literal["Single", "Multiple"]] = Mode.SINGLE, auto_deinit: bool = True, log_file_path: Optional[str] = None) -> None:
+    def configure(
+        cls, *, 
+        mode: Union[Mode, Literal["Single", "Multiple"]] = Mode.SINGLE, 
+        auto_deinit: bool = True, 
+        log_file_path: Optional[str] = None,
+        log_max_bytes: int = 0,
+        log_rotate_interval: float = 0,
+        log_backup_count: int = 3,
+        history: bool = True,
+        history_formattings: Optional[int] = 1000,
+        history_inputs: Optional[int] = 1000,
+        buffered: bool = False,
+        concurrent: bool = False,
+        backend: Literal["auto", "native", "colorama"] = "auto",
+        color_level: Optional[ColorLevel] = None
+    ) -> None:
         cls.set_env_mode(mode)
         Config.AUTO_DEINIT = auto_deinit
+        if Config.LOGGING.LOG_FILE_PATH != log_file_path:
+            LogSink.close()
         Config.LOGGING.LOG_FILE_PATH = log_file_path
+        Config.LOGGING.MAX_BYTES = log_max_bytes
+        Config.LOGGING.ROTATE_INTERVAL = log_rotate_interval
+        Config.LOGGING.BACKUP_COUNT = log_backup_count
+        Config.HISTORY.ENABLED = history
+        Config.HISTORY.FORMATTINGS = history_formattings
+        Config.HISTORY.INPUTS = history_inputs
+        History.resize()
+        if Config.OUTPUT.BUFFERED and not buffered:
+            Output.flush()
+        Config.OUTPUT.BUFFERED = buffered
+        Config.OUTPUT.CONCURRENT = concurrent
+        Config.OUTPUT.BACKEND = backend
+        Config.OUTPUT.COLOR_LEVEL = color_level
+        if cls._initialized:
+            # The level and backend are chosen again, the color keys and templates follow them
+            cls.colorama_deinit()
+            cls._initialized = False
+            cls.colorama_init()
+        if not concurrent:
+            Output.stop()
         if not cls._initialized:
             cls.init()
 
+    @classmethod
+    def start(cls) -> None:
+        with cls._start_lock:
+            if not cls._started:
+                cls.init()
+            elif cls._signal_pending:
+                cls._install_signal_handler()
+
     @classmethod
     def init(cls) -> None:
+        cls._started = True
         cls.colorama_init()
         cls.regex_init()
+        atexit.register(cleanup) # Queued log records always reach the file, deinit is left to AUTO_DEINIT
         if Config.AUTO_DEINIT:
-            atexit.register(cleanup)
-            signal.signal(signal.SIGINT, signal_handler)
+            cls._signal_pending = True
+            cls._install_signal_handler()
+
+    @classmethod
+    def _install_signal_handler(cls) -> None:
+        # Handlers can only be installed from the main thread, the first output there does it otherwise
+        if threading.current_thread() is not threading.main_thread():
+            return
+        cls._signal_pending = False
+        signal.signal(signal.SIGINT, signal_handler)
     
     @classmethod
     def deinit(cls) -> None:
-        sys.stdout.write('\033[0m')
+        if cls.level():
+            Output.write('\033[0m')
+        Output.flush()
         cls.colorama_deinit()
         cls.ColorKeys.clear()
+        cls.invalidate_templates()
         cls._initialized = False
 
     @classmethod
     def colorama_init(cls) -> None:
         if cls._initialized: return
-        colorama.init()
-        cls.Fore = colorama.Fore
-        cls.Style = colorama.Style
-        cls.Back = colorama.Back
-        cls.ColorKeys = {
-            i.tag: i for i in [
-                cls.Color(cls.Fore.BLACK, tag="$bla"),
-                cls.Color(cls.Fore.BLUE, tag="$blu"),
-                cls.Color(cls.Fore.CYAN, tag="$cya"),
-                cls.Color(cls.Fore.GREEN, tag="$gre"),
-                cls.Color(cls.Fore.MAGENTA, tag="$mag"),
-                cls.Color(cls.Fore.RED, tag="$red"),
-                cls.Color(cls.Fore.WHITE, tag="$whi"),
-                cls.Color(cls.Fore.YELLOW, tag="$yel"),
-                cls.Color(cls.Style.BRIGHT, tag="$bri"),
-                cls.Color(cls.Style.DIM, tag="$dim"),
-                cls.Color(cls.Style.RESET_ALL, tag="$res")
-            ]
-        }
+        cls.color_level = None
+        cls.backend = Config.OUTPUT.BACKEND
+        if cls.backend == "auto":
+            # Only Windows consoles without VT processing need colorama to convert the sequences,
+            # elsewhere it would strip them whenever color is forced onto a non-tty
+            cls.backend = "colorama" if os.name == "nt" and cls.level() and not supports_vt(sys.stdout) else "native"
+        if cls.backend == "colorama":
+            import colorama # Only needed to convert or strip the sequences
+            colorama.init()
+        Output.strip = cls.backend == "native" and not cls.level()
+        # Without color the tags are still removed, but nothing is emitted
+        cls.ColorKeys.update((tag, cls.Color(ansi if cls.level() else "", tag=tag)) for tag, ansi in cls._color_keys)
+        cls.invalidate_templates()
         cls._initialized = True
     
+    @classmethod
+    def level(cls) -> ColorLevel:
+        if cls.color_level is None:
+            cls.color_level = Config.OUTPUT.COLOR_LEVEL if Config.OUTPUT.COLOR_LEVEL is not None else detect_level(sys.stdout)
+        return cls.color_level
+    
     @classmethod
     def colorama_deinit(cls) -> None:
-        colorama.deinit()
-        for color in [
-            cls.Color(cls.Fore.BLACK, tag="$bla"),
-            cls.Color(cls.Fore.BLUE, tag="$blu"),
-            cls.Color(cls.Fore.CYAN, tag="$cya"),
-            cls.Color(cls.Fore.GREEN, tag="$gre"),
-            cls.Color(cls.Fore.MAGENTA, tag="$mag"),
-            cls.Color(cls.Fore.RED, tag="$red"),
-            cls.Color(cls.Fore.WHITE, tag="$whi"),
-            cls.Color(cls.Fore.YELLOW, tag="$yel"),
-            cls.Color(cls.Style.BRIGHT, tag="$bri"),
-            cls.Color(cls.Style.DIM, tag="$dim"),
-            cls.Color(cls.Style.RESET_ALL, tag="$res")
-        ]: cls.ColorKeys.pop(color.tag)
+        if cls.backend == "colorama":
+            import colorama
+            colorama.deinit()
+        cls.backend = None
+        Output.strip = False
+        for tag, _ in cls._color_keys:
+            cls.ColorKeys.pop(tag, None)
+        cls.invalidate_templates()
     
     @classmethod
     def regex_init(cls) -> None:
         cls._regex = re.compile(cls.pattern)
+        cls.invalidate_templates()
+    
+    @classmethod
+    def invalidate_templates(cls) -> None:
+        with cls._templates_lock:
+            cls._colors_version += 1
+            cls._templates.clear()
+    
+    @classmethod
+    def _admit(cls, template: str) -> bool:
+        if Config.FORMATTING.CACHE_SIZE <= 0 or len(template) > Config.FORMATTING.CACHE_MAX_LENGTH:
+            return False
+        key = hash(template) # Only the hash is kept for text that is not cached (yet)
+        if key in cls._sightings:
+            return True
+        if len(cls._sightings) >= 4 * Config.FORMATTING.CACHE_SIZE:
+            cls._sightings.clear()
+        cls._sightings.add(key)
+        return False
+    
+    @classmethod
+    def compile(cls, template: str) -> "Terminal.Template":
+        if not cls._initialized:
+            cls.colorama_init()
+        compiled = cls._templates.get(template)
+        if compiled is not None:
+            try:
+                cls._templates.move_to_end(template)
+            except KeyError:
+                pass # Evicted by another thread in the meantime
+            return compiled
+        compiled = cls.Template(template)
+        if Config.FORMATTING.CACHE_SIZE > 0 and len(template) <= Config.FORMATTING.CACHE_MAX_LENGTH:
+            with cls._templates_lock:
+                cls._templates[template] = compiled
+                while len(cls._templates) > Config.FORMATTING.CACHE_SIZE:
+                    cls._templates.popitem(last=False)
+        return compiled
     
     @classmethod
     def new_env(cls, prefix: Optional[Color] = None, suffix: Optional[Color] = None) -> Manager.Environment:
@@ -463,10 +1077,9 @@ class Terminal:
     def clear(*, ansi: bool = False, flush: bool = True) -> None:
         if Terminal.blocking: return
         if ansi:
-            sys.stdout.write("\033[2J\033[H")
-            if flush:
-                sys.stdout.flush()
+            Output.write("\033[2J\033[H", flush=flush)
         else:
+            Output.flush() # Anything still buffered belongs before the clear
             os.system("cls" if os.name == "nt" else "clear")
     
     @classmethod
@@ -492,10 +1105,13 @@ class Terminal:
         if tag is None:
             raise KeyError("A tag must be provided either via parameter or in the Color object")
         cls.ColorKeys[tag] = color
+        cls.invalidate_templates()
     
     @classmethod
     def pop_color(cls, tag: str, default: Optional[Color] = None) -> str:
-        return cls.ColorKeys.pop(tag, default)
+        color = cls.ColorKeys.pop(tag, default)
+        cls.invalidate_templates()
+        return color
     
     @classmethod
     def format(
@@ -508,15 +1124,24 @@ class Terminal:
 
         suffix = suffix + (end or "")
         text = cls.manager.format((sep or " ").join(map(str, values)))
-        History.formattings.append(text)
+        if Config.HISTORY.ENABLED:
+            History.formattings.append(text)
         if not color:
             return prefix + text + suffix
-        
+        compiled = cls._templates.get(text)
+        if compiled is not None:
+            return cls.compile(text).render(prefix, suffix)
         if not cls._regex:
             cls.regex_init()
-
-        formatted = cls._regex.sub(lambda m: str(cls.ColorKeys.get(m.group(0), m.group(0))), text)
-        return prefix + formatted + suffix
+        parts = cls._regex.split(text)
+        if len(parts) == 1:
+            return prefix + text + suffix # No tags, nothing worth caching
+        if cls._admit(text):
+            return cls.compile(text).render(prefix, suffix)
+        # Only text seen before is cached, so one-off lines are substituted in place
+        keys = cls.ColorKeys
+        parts[1::2] = [str(keys.get(tag, tag)) for tag in parts[1::2]]
+        return prefix + "".join(parts) + suffix
     
     @staticmethod
     def progress_bar(
@@ -548,9 +1173,54 @@ class Terminal:
                 Terminal.clear(ansi=False)
         text = Terminal.format(*values, sep=sep, end=end, color=color, prefix=prefix, suffix=suffix)
         if Terminal.blocking: return
-        sys.stdout.write(text)
-        if flush:
-            sys.stdout.flush()
+        Output.write(text, flush)
+    
+    @classmethod
+    def print_stream(
+        cls, 
+        lines: Iterable[object], 
+        *, 
+        end: Optional[str] = "\n", 
+        flush: bool = True, 
+        color: bool = False, 
+        chunk_size: int = 1 << 16
+    ) -> None:
+        if Terminal.blocking: return
+        if color and not cls._initialized:
+            cls.colorama_init()
+        end = end or ""
+        try:
+            chunk, size = [], 0
+            for line in lines: # Pulled one at a time, only a chunk is ever held
+                line = str(line) + end
+                chunk.append(line)
+                size += len(line)
+                if size >= chunk_size:
+                    cls._write_chunk("".join(chunk), color)
+                    chunk, size = [], 0
+            if chunk:
+                cls._write_chunk("".join(chunk), color)
+            if flush:
+                Output.flush()
+        except BrokenPipeError:
+            cls._discard_stdout()
+    
+    @classmethod
+    def _write_chunk(cls, text: str, color: bool) -> None:
+        text = cls.manager.format(text, record=False) # A stream is not kept around, neither are its chunks
+        if color:
+            text = cls.Template(text).value # Not cached, a chunk is rarely seen twice and would push out the real templates
+        Output.write(text)
+    
+    @staticmethod
+    def _discard_stdout() -> None:
+        # The reader went away, as with `| head`, so everything after, including the flush at exit, goes nowhere
+        try:
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            os.close(devnull)
+        except (AttributeError, OSError, ValueError):
+            sys.stdout = open(os.devnull, "w")
     
     @staticmethod
     def input(
@@ -564,41 +1234,107 @@ class Terminal:
         n: int = -1
     ) -> str:
         if Terminal.blocking: return ""
-        if prompt: # We may only use input_text
-            Terminal.print(*prompt, sep=sep, end=end, flush=flush, color=color, clear_screen=clear_screen)
+        Terminal._prompt(*prompt, sep=sep, end=end, flush=flush, color=color, clear_screen=clear_screen)
         if n == -1:
             text = input(input_text or "")
         else:
             text = sys.stdin.read(n)
-        History.inputs.append(text)
+        return Terminal._record_input(text)
+    
+    @staticmethod
+    async def ainput(
+        *prompt: object,
+        sep: Optional[str] = " ",
+        end: Optional[str] = "",
+        flush: bool = False,
+        color: bool = False,
+        clear_screen: ClearScreenArg = False,
+        input_text: Optional[str] = "",
+        n: int = -1
+    ) -> str:
+        if Terminal.blocking: return ""
+        Terminal._prompt(*prompt, sep=sep, end=end, flush=flush, color=color, clear_screen=clear_screen)
+        if input_text and n == -1:
+            Output.write(input_text, flush=True)
+        text = await Terminal._read_stdin(n)
+        if n == -1:
+            if not text:
+                raise EOFError
+            text = text[:-1] if text.endswith("\n") else text
+        return Terminal._record_input(text)
+    
+    @staticmethod
+    async def aprint(
+        *values: object,
+        sep: Optional[str] = " ",
+        end: Optional[str] = "\n",
+        flush: bool = False,
+        color: bool = False,
+        clear_screen: ClearScreenArg = False,
+        prefix: str = "",
+        suffix: str = "",
+    ) -> None:
+        Terminal.print(*values, sep=sep, end=end, flush=flush, color=color, clear_screen=clear_screen, prefix=prefix, suffix=suffix)
+        import asyncio # Already loaded whenever a loop is running
+        await asyncio.sleep(0) # Let the other tasks on the loop run between prints
+    
+    @staticmethod
+    def _prompt(*prompt: object, **kwargs: Any) -> None:
+        if prompt: # We may only use input_text
+            Terminal.print(*prompt, **kwargs)
+        Output.flush() # The prompt has to be visible before we block, also when buffered or captured
+    
+    @staticmethod
+    def _record_input(text: str) -> str:
+        Output.echo(text)
+        if Config.HISTORY.ENABLED:
+            History.inputs.append(text)
         return text
     
+    @staticmethod
+    async def _read_stdin(n: int = -1) -> str:
+        import asyncio
+        loop = asyncio.get_running_loop()
+        read = sys.stdin.readline if n == -1 else lambda: sys.stdin.read(n)
+        # Only an interactive stdin is line-buffered by the terminal, so a ready fd means a whole line
+        if not sys.stdin.isatty():
+            return await loop.run_in_executor(None, read)
+        try:
+            fd = sys.stdin.fileno()
+            future = loop.create_future()
+            loop.add_reader(fd, lambda: future.done() or future.set_result(None))
+        except (NotImplementedError, AttributeError, ValueError, OSError):
+            return await loop.run_in_executor(None, read) # Proactor loops cannot watch stdin
+        try:
+            await future
+        finally:
+            loop.remove_reader(fd)
+        return read()
+    
     @classmethod
     def set_color(cls, color: Color) -> None:
         if Terminal.blocking: return
-        sys.stdout.write(str(color))
-        sys.stdout.flush()
+        Output.write(str(color), flush=not Output.buffering())
     
     @staticmethod
     def log(
         *msg: object, format: str = "[[level]] [msg]", level: Literal["INFO", "WARN", "ERROR"] = "INFO", time_format: str = "%H:%M", color: bool = True
     ) -> None:
+        if not Terminal._started or Terminal._signal_pending:
+            Terminal.start()
         text = format.replace("[time]", datetime.datetime.now().strftime(time_format)).replace("[level]", Config.LOGGING.COLORS[level]+level+"$res" if color else level).replace("[msg]", " ".join([str(v) for v in msg]))
 
         if Config.LOGGING.LOG_FILE_PATH and Terminal._initialized: 
-            clean_text = Terminal.strip_ansi(Terminal.remove_tags(text))+"\n"
-            with open(Config.LOGGING.LOG_FILE_PATH, "a") as f:
-                f.write(clean_text)
+            LogSink.emit(text) # Cleaned and written by the sink's writer thread
         
         if Terminal.blocking: return
         
-        sys.stdout.write(Terminal.format(text, end="\n", color=color)) # Adding the default newline
-        sys.stdout.flush()
+        Output.write(Terminal.format(text, end="\n", color=color), flush=not Output.buffering()) # Adding the default newline
     
     @staticmethod
     def space() -> None:
         if Terminal.blocking: return
-        Terminal.Simple.space()
+        Output.write("\n")
     
     @classmethod
     def strip_ansi(cls, text: str) -> str:
@@ -606,13 +1342,26 @@ class Terminal:
     
     @classmethod
     def remove_tags(cls, text: str) -> str:
+        if not cls._regex:
+            cls.regex_init()
         return cls._regex.sub('', text)
     
     @staticmethod
     def get_size() -> Tuple[int, int]:
         return os.get_terminal_size()
+    
+    @staticmethod
+    def batch():
+        return Output.batch()
+    
+    @staticmethod
+    def flush() -> None:
+        Output.flush()
 
 def cleanup() -> None:
+    LogSink.close()
+    Output.stop()
+    Output.flush()
     if not Config.AUTO_DEINIT: return
     Terminal.deinit()
 
@@ -2,8 +2,13 @@
 The core features for the terminal.
 """
 
-from typing import Iterable, Tuple, List, Dict, Optional, Callable, Literal, Union, TypeVar, Any, overload
-from .enums import Mode
+from typing import Iterable, Tuple, List, Dict, Optional, Callable, Literal, Union, TypeVar, Any, Deque, Type, overload
+from collections import OrderedDict, deque
+from contextlib import AbstractContextManager
+from .enums import Mode, ColorLevel
+from .sgr import Fore, Back, Style
+import threading
+import queue
 import re
 
 T = TypeVar("T", bound="Terminal.Color")
@@ -12,27 +17,166 @@ ClearScreenArg = Union[bool, Tuple[bool, bool], Tuple[bool, bool, bool]]
 class Config:
     class LOGGING:
         LOG_FILE_PATH: Optional[str]
+        MAX_BYTES: int
+        ROTATE_INTERVAL: float
+        BACKUP_COUNT: int
+        BATCH_SIZE: int
         COLORS: Dict[str, str]
+    class FORMATTING:
+        CACHE_SIZE: int
+        CACHE_MAX_LENGTH: int
+        COLOR_CACHE_SIZE: int
+    class HISTORY:
+        ENABLED: bool
+        FORMATTINGS: Optional[int]
+        INPUTS: Optional[int]
+    class OUTPUT:
+        BUFFERED: bool
+        BUFFER_SIZE: int
+        FLUSH_INTERVAL: float
+        CONCURRENT: bool
+        BATCH_SIZE: int
+        BACKEND: Literal["auto", "native", "colorama"]
+        COLOR_LEVEL: Optional[ColorLevel]
     AUTO_DEINIT: bool
 
 class History:
-    formattings: List[str]
-    inputs: List[str]
+    """Ring buffers of recent formattings and inputs. Capacities are set through `Terminal.configure`."""
+
+    formattings: deque[str]
+    inputs: deque[str]
+
+    @classmethod
+    def resize(cls) -> None:
+        """Apply the configured capacities, keeping the newest entries."""
+        ...
+    
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all recorded entries."""
+        ...
+    
+    @classmethod
+    def stats(cls) -> Dict[str, Dict[str, Optional[int]]]:
+        """Entry count, capacity and approximate bytes held, per category."""
+        ...
+
+class Output:
+    """
+    The single write path to stdout. 
+    While buffering, writes are collected and emitted as one write once the buffer 
+    passes `Config.OUTPUT.BUFFER_SIZE` characters or `Config.OUTPUT.FLUSH_INTERVAL` seconds. 
+    In buffered mode a timer flushes after the interval even when nothing else is written.
+    In concurrent mode, writes are queued whole and a single writer thread drains them in batches. 
+    At `ColorLevel.NONE` on the native backend, color sequences are stripped from everything written.
+    """
+
+    class Batch(threading.local):
+        """The writes a thread collects inside `batch`, kept per thread."""
+        depth: int
+        size: int
+        since: float
+        buffer: List[str]
+
+        def __init__(self) -> None:
+            ...
+
+    target: Optional[Any]
+    reads: int
+    strip: bool
+    _buffer: List[str]
+    _size: int
+    _since: float
+    _batch: Batch
+    _lock: threading.RLock
+    _queue: Optional[queue.Queue[Optional[str]]]
+    _writer: Optional[threading.Thread]
+    _error: Optional[BaseException]
+    _timer: Optional[threading.Timer]
+
+    @classmethod
+    def stream(cls) -> Any:
+        """The stream written to: `target` when set, stdout otherwise."""
+        ...
+
+    @classmethod
+    def buffering(cls) -> bool:
+        """Whether writes are currently being buffered, globally or by a batch."""
+        ...
+    
+    @classmethod
+    def write(cls, text: str, flush: bool = False) -> None:
+        """Write text, or buffer it while buffering. `flush` always empties the buffer."""
+        ...
+    
+    @classmethod
+    def flush(cls) -> None:
+        """
+        Emit everything buffered as a single write and flush stdout. Waits for the writer thread if running, 
+        and raises the error a write of it failed with, if any. A closed pipe only stops the output.
+        """
+        ...
+    
+    @classmethod
+    def stop(cls) -> None:
+        """Write out everything queued and stop the writer thread of the concurrent mode."""
+        ...
+    
+    @classmethod
+    def batch(cls) -> AbstractContextManager[None]:
+        """
+        Buffer the calling thread's writes inside the context, flushing once on exit. 
+        Other threads keep writing as before, and a `flush` inside the context writes out the batch so far.
+        """
+        ...
+    
+    @classmethod
+    def echo(cls, text: str) -> None:
+        """Pass input the terminal echoed on to the target, if it accepts it."""
+        ...
+
+class LogSink:
+    """
+    Writes log records to `Config.LOGGING.LOG_FILE_PATH` from a background thread. 
+    The file stays open, records are written in batches and the file is rotated by size or age.
+    """
+
+    _queue: Optional[queue.Queue[Optional[str]]]
+    _thread: Optional[threading.Thread]
+    _error: Optional[BaseException]
+    _lock: threading.Lock
+
+    @classmethod
+    def emit(cls, text: str) -> None:
+        """
+        Queue a record. Tags and ansi codes are removed on the writer thread. 
+        The first record opens the file, so a bad path raises here; a failed write or rotation raises from the next call.
+        """
+        ...
+    
+    @classmethod
+    def flush(cls) -> None:
+        """Block until every queued record has been written. Raises the error a write failed with, if any."""
+        ...
+    
+    @classmethod
+    def close(cls) -> None:
+        """Write out all queued records and close the file. The next record reopens it."""
+        ...
 
 class Manager:
     """The manager handles terminal environments."""
 
     env_stack: List[Manager.Environment]
     mode: Mode
+    lock: threading.RLock
+    chain: Tuple[Manager.Environment, ...]
 
     class Environment:
         """An environment contain vital details and schematics for your terminal."""
 
         manager: Manager
-        prefix_color: Optional[Terminal.Color]
-        suffix_color: Optional[Terminal.Color]
-        active: bool
-        formatted: List[str]
+        formatted: Deque[str]
 
         class GlobalInterface:
             """Public interface for an active environment context."""
@@ -57,7 +201,7 @@ class Manager:
             
             @property
             def formatted(self) -> List[str]:
-                """A list of all formatted strings."""
+                """A list of the latest formatted strings."""
                 ...
             
             def format(self, text: str) -> str:
@@ -79,6 +223,33 @@ class Manager:
             suffix: Optional["Terminal.Color"] = None
         ) -> None: ...
 
+        @property
+        def prefix_color(self) -> Optional[Terminal.Color]:
+            """The prefix color. Setting it invalidates the manager's composite."""
+            ...
+        
+        @prefix_color.setter
+        def prefix_color(self, color: Optional[Terminal.Color]) -> None:
+            ...
+        
+        @property
+        def suffix_color(self) -> Optional[Terminal.Color]:
+            """The suffix color. Setting it invalidates the manager's composite."""
+            ...
+        
+        @suffix_color.setter
+        def suffix_color(self, color: Optional[Terminal.Color]) -> None:
+            ...
+        
+        @property
+        def active(self) -> bool:
+            """Whether this environment is active. Setting it rebuilds the manager's chain."""
+            ...
+        
+        @active.setter
+        def active(self, active: bool) -> None:
+            ...
+        
         @property
         def prefix(self) -> str:
             """The prefix in ansi characters."""
@@ -103,8 +274,8 @@ class Manager:
         def __exit__(self, *args) -> None:
             ...
         
-        def format(self, text: str) -> str:
-            """Format a text."""
+        def format(self, text: str, record: bool = True) -> str:
+            """Format a text. The text is kept in `formatted`, capped like History, unless History is disabled or `record` is false."""
             ...
         
         def reset(self) -> None:
@@ -119,12 +290,27 @@ class Manager:
         """Wheter this manager is active."""
         ...
     
+    def rebuild(self) -> None:
+        """Recompute `chain` from the stack. Done whenever an environment is enabled, disabled or reset."""
+        ...
+    
+    def invalidate(self) -> None:
+        """Drop the cached composite, as when an environment's colors change."""
+        ...
+    
+    def composite(self, chain: Optional[Tuple[Environment, ...]] = None) -> Tuple[str, str]:
+        """
+        The combined prefix and suffix of all environments in `chain`, the active ones by default. 
+        Used by `Mode.MULTIPLE` to wrap a text with a single concatenation.
+        """
+        ...
+    
     def disable(self) -> None:
         """Disable all active environments."""
         ...
     
-    def format(self, text: str) -> str:
-        """Apply formatting from environments. (Depends on mode)"""
+    def format(self, text: str, record: bool = True) -> str:
+        """Apply formatting from environments. (Depends on mode) Pass `record=False` to leave `formatted` untouched."""
         ...
     
     def new_env(self, prefix: Optional["Terminal.Color"] = None, suffix: Optional["Terminal.Color"] = None) -> Environment:
@@ -138,8 +324,16 @@ class Terminal:
     manager: Manager
     pattern: str
     blocking: bool
+    Fore: Type[Fore]
+    Back: Type[Back]
+    Style: Type[Style]
+    backend: Optional[Literal["native", "colorama"]]
+    color_level: Optional[ColorLevel]
     _initialized: bool
     _regex: Optional[re.Pattern]
+    _templates: OrderedDict[str, "Terminal.Template"]
+    _templates_lock: threading.Lock
+    _colors_version: int
 
     class Simple:
         """Disconnected, minimal terminal I/O."""
@@ -172,7 +366,12 @@ class Terminal:
             ...
     
     class Color:
-        """Represents an ANSI color sequence."""
+        """
+        Represents an ANSI color sequence. 
+        Colors are immutable and hash like their ansi string, so they can be dict keys and set members. 
+        Copies are the color itself, and colors pickle with their tag, e.g. to cross a process pool.
+        """
+        __slots__ = ("ansi", "tag")
 
         ansi: str
         tag: Optional[str]
@@ -187,12 +386,18 @@ class Terminal:
         
         @classmethod
         def rgb(cls, r: int, g: int, b: int) -> "Terminal.Color":
-            """Retrieve a color with the given rgb."""
+            """
+            Retrieve a color with the given rgb, quantized to the terminal's color level. 
+            Repeated calls return the same interned object.
+            """
             ...
         
         @classmethod
         def bg_rgb(cls, r: int, g: int, b: int) -> "Terminal.Color":
-            """Retrieve a color with the given rgb as background."""
+            """
+            Retrieve a color with the given rgb as background, quantized to the terminal's color level. 
+            Repeated calls return the same interned object.
+            """
             ...
         
         def paint(self, text: str) -> str:
@@ -223,6 +428,9 @@ class Terminal:
         def __eq__(self, other: object) -> bool:
             ...
         
+        def __hash__(self) -> int:
+            ...
+        
         def __add__(
             self, other: Union[str, "Terminal.Color", Iterable[Union[str, "Terminal.Color"]]]
         ) -> "Terminal.Color": ...
@@ -231,6 +439,31 @@ class Terminal:
             cls, key: Union[Tuple[Literal["Tag","ColorKey","Ansi"], str], str]
         ) -> "Terminal.Color": ...
     
+    class Template:
+        """A tagged string parsed once into literal and color segments."""
+
+        source: str
+        segments: Tuple[Union[str, "Terminal.Color"], ...]
+        value: str
+        version: int
+
+        def __init__(self, source: str) -> None:
+            ...
+        
+        def compile(self) -> None:
+            """Parse the source against the current color keys."""
+            ...
+        
+        def render(self, prefix: str = "", suffix: str = "") -> str:
+            """Render the template. Recompiles if the color keys changed since the last compile."""
+            ...
+        
+        def __str__(self) -> str:
+            ...
+        
+        def __repr__(self) -> str:
+            ...
+    
     class IOString: 
         """I/O string wrapper that can use Terminal print/input methods."""
 
@@ -337,31 +570,102 @@ class Terminal:
             ...
     
     class ProgressBar(AnimatedString):
-        """Animated progress bar that precomputes frames for efficiency."""
+        """Animated progress bar. Frames are rendered on demand from a template split once."""
+
+        class Frames:
+            """Lazy frame sequence of a progress bar. Assigned frames are kept as overrides."""
+
+            bar: "Terminal.ProgressBar"
+            overrides: Dict[int, str]
+
+            def __init__(self, bar: "Terminal.ProgressBar") -> None:
+                ...
+            
+            def __len__(self) -> int:
+                ...
+            
+            def __getitem__(self, index: int) -> str:
+                ...
+            
+            def __setitem__(self, index: int, value: str) -> None:
+                ...
+            
+            def __iter__(self) -> Iterable[str]:
+                ...
 
         formatted_string: str
         token: str
+        empty: Optional[str]
         length: int
+        frames: Frames # type: ignore[assignment]
+        parts: List[str]
+        cells: int
+        percent: int
 
-        def __init__(self, formatted_string: str, token: str, length: int) -> None:
+        def __init__(self, formatted_string: str, token: str, length: int, empty: Optional[str] = None) -> None:
+            """`empty` is the token for the remaining cells. Defaults to `token`."""
             ...
         
         def generate(self) -> None:
-            """Generate all frames of the progress bar."""
+            """Split the template for rendering. Call again after changing the template, token or length."""
             ...
         
         def calc_index(self, has: int, need: int) -> int:
             "Calculate what index is appropiate for the given corelation."
             ...
+        
+        def render(self, has: float, need: float) -> str:
+            """Render the bar for the given progress."""
+            ...
+        
+        def update(self, has: float, need: float, *, flush: bool = True) -> bool:
+            """
+            Redraw the bar in place, but only when the visible cells or the percentage changed. 
+            Returns whether it was redrawn.
+            """
+            ...
     
     @classmethod
-    def configure(cls, *, mode: Union[Mode, Literal["Single", "Multiple"]] = Mode.SINGLE, auto_deinit: bool = True, log_file_path: Optional[str] = None) -> None:
-        """Configure the terminal."""
+    def configure(
+        cls, *, 
+        mode: Union[Mode, Literal["Single", "Multiple"]] = Mode.SINGLE, 
+        auto_deinit: bool = True, 
+        log_file_path: Optional[str] = None,
+        log_max_bytes: int = 0,
+        log_rotate_interval: float = 0,
+        log_backup_count: int = 3,
+        history: bool = True,
+        history_formattings: Optional[int] = 1000,
+        history_inputs: Optional[int] = 1000,
+        buffered: bool = False,
+        concurrent: bool = False,
+        backend: Literal["auto", "native", "colorama"] = "auto",
+        color_level: Optional[ColorLevel] = None
+    ) -> None:
+        """
+        Configure the terminal. 
+        Pass `history=False` to stop recording, or `None` as a capacity for no limit. 
+        Pass `buffered=True` to buffer all output, as if inside `batch`. Whatever is still buffered is written at exit, 
+        also with `auto_deinit=False`.
+        Pass `concurrent=True` when many threads print or log, so every line is written whole by one writer thread.
+        `backend` picks how output reaches the terminal: "auto" writes natively everywhere but on Windows consoles 
+        without virtual terminal processing, which go through colorama.
+        `color_level` forces a color level, `None` detects it. 
+        Both apply right away, the color keys and cached templates are rebuilt for them.
+        """
+        ...
+    
+    @classmethod
+    def start(cls) -> None:
+        """
+        Initiate the terminal unless it already is. Called by the first output, from any thread. 
+        The interrupt handler is installed by the first output on the main thread.
+        """
         ...
     
     @classmethod
     def init(cls) -> None:
-        """Initiate the terminal."""
+        """Initiate the terminal. Importing the package no longer does this, the first output does."""
         ...
     
     @classmethod
@@ -371,12 +675,25 @@ class Terminal:
     
     @classmethod
     def colorama_init(cls) -> None:
-        """Initiate the colorama module and load all colors. [See `init`]"""
+        """
+        Choose the output backend and load all colors. [See `init`] 
+        Terminals that interpret the sequences themselves are written to directly, 
+        colorama only wraps stdout on Windows consoles where they have to be converted.
+        """
+        ...
+    
+    @classmethod
+    def level(cls) -> ColorLevel:
+        """
+        The color level of the terminal, from `Config.OUTPUT.COLOR_LEVEL` or detected from 
+        `NO_COLOR`, whether stdout is a terminal, `COLORTERM` and `TERM`. 
+        At `ColorLevel.NONE` the color keys and rgb colors emit nothing.
+        """
         ...
     
     @classmethod
     def colorama_deinit(cls) -> None:
-        """Deinitate the colorama module and unload all colors. [See `deinit`]"""
+        """Unwrap stdout if colorama wrapped it and unload all colors. [See `deinit`]"""
         ...
     
     @classmethod
@@ -384,6 +701,16 @@ class Terminal:
         """Initiate the regex-pattern. [See `init`]"""
         ...
     
+    @classmethod
+    def invalidate_templates(cls) -> None:
+        """Drop all cached templates. Called whenever the color keys change."""
+        ...
+    
+    @classmethod
+    def compile(cls, template: str) -> "Terminal.Template":
+        """Compile a tagged string, reusing the cached template when possible. Strings longer than `Config.FORMATTING.CACHE_MAX_LENGTH` are compiled without being cached."""
+        ...
+    
     @classmethod
     def new_env(cls, prefix: Optional[Color] = None, suffix: Optional[Color] = None) -> Manager.Environment:
         """Create a new environment."""
@@ -451,7 +778,7 @@ class Terminal:
         sep: Optional[str] = " ", end: Optional[str] = "",
         color: bool = True, prefix: str = "", suffix: str = ""
     ) -> str:
-        """Format values with optional color substitution."""
+        """Format values with optional color substitution. Only tagged text that was formatted before is kept in the template cache; one-off and untagged text is rendered directly."""
         ...
     
     @staticmethod
@@ -485,6 +812,24 @@ class Terminal:
         """
         ...
     
+    @classmethod
+    def print_stream(
+        cls, 
+        lines: Iterable[object], 
+        *, 
+        end: Optional[str] = "\n", 
+        flush: bool = True, 
+        color: bool = False, 
+        chunk_size: int = 1 << 16
+    ) -> None:
+        """
+        Print every item of `lines`, each followed by `end`, pulling them lazily from any iterable or generator. 
+        Lines are gathered into chunks of about `chunk_size` characters, which are formatted and written as one block, 
+        so memory stays constant however long the stream. Chunks are not recorded in History or in the environments. 
+        If the reader goes away, as when piped into `head`, the rest of the output is discarded and it returns normally.
+        """
+        ...
+    
     @staticmethod
     def input(
         *prompt: object,
@@ -507,6 +852,37 @@ class Terminal:
         """
         ...
     
+    @staticmethod
+    async def ainput(
+        *prompt: object,
+        sep: Optional[str] = " ",
+        end: Optional[str] = "",
+        flush: bool = False,
+        color: bool = False,
+        clear_screen: ClearScreenArg = False,
+        input_text: Optional[str] = "",
+        n: int = -1
+    ) -> str:
+        """
+        Like `input`, but awaits the user on the running event loop instead of blocking it. 
+        Interactive stdin is watched through the loop's reader, anything else is read on an executor.
+        """
+        ...
+    
+    @staticmethod
+    async def aprint(
+        *values: object,
+        sep: Optional[str] = " ",
+        end: Optional[str] = "\n",
+        flush: bool = False,
+        color: bool = False,
+        clear_screen: ClearScreenArg = False,
+        prefix: str = "",
+        suffix: str = "",
+    ) -> None:
+        """Like `print`, then yields to the other tasks on the event loop."""
+        ...
+    
     @classmethod
     def set_color(cls, color: Color) -> None:
         """Immediately set console color without newline."""
@@ -537,4 +913,14 @@ class Terminal:
     @staticmethod
     def get_size() -> Tuple[int, int]:
         """Get the terminal size."""
+        ...
+    
+    @staticmethod
+    def batch() -> AbstractContextManager[None]:
+        """Collect all output inside the context and write it in as few writes as possible."""
+        ...
+    
+    @staticmethod
+    def flush() -> None:
+        """Write out anything buffered."""
         ...
\ No newline at end of file
@@ -1,5 +1,7 @@
 from typing import Optional, Literal, Union
-from enum import Enum
+from enum import Enum, IntEnum
+
+__all__ = ("Mode", "ColorLevel")
 
 class Mode(Enum):
     SINGLE = Literal["Single"]
@@ -14,3 +16,8 @@ class Mode(Enum):
         item = item.upper()
         return cls.__members__.get(item)
 
+class ColorLevel(IntEnum):
+    NONE = 0 # No sequences at all
+    COLORS_16 = 1
+    COLORS_256 = 2
+    TRUECOLOR = 3
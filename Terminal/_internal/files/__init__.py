@@ -1,4 +1,7 @@
 from .files import File, Directory, FileManager
+from .view import FileView
+from .cache import StatCache
+from .scanner import DirStats, Scanner
 from .enums import ItemType
 
 __all__ = ("FileSystem",)
@@ -7,4 +10,8 @@ class FileSystem:
     File = File
     Directory = Directory
     FileManager = FileManager
+    FileView = FileView
+    StatCache = StatCache
+    DirStats = DirStats
+    Scanner = Scanner
     ItemType = ItemType
\ No newline at end of file
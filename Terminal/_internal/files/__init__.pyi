@@ -1,5 +1,8 @@
 from typing import Type
 from .files import File, Directory, FileManager
+from .view import FileView
+from .cache import StatCache
+from .scanner import DirStats, Scanner
 from .enums import ItemType
 
 class FileSystem:
@@ -10,4 +13,8 @@ class FileSystem:
     File: Type[File]
     Directory: Type[Directory]
     FileManager: Type[FileManager]
+    FileView: Type[FileView]
+    StatCache: Type[StatCache]
+    DirStats: Type[DirStats]
+    Scanner: Type[Scanner]
     ItemType: Type[ItemType]
\ No newline at end of file
@@ -0,0 +1,82 @@
+from typing import Dict, Optional, Set, Tuple, Union
+from pathlib import Path
+import threading
+import os
+
+__all__ = ("StatCache",)
+
+Signature = Tuple[int, int, int]
+
+class StatCache:
+    def __init__(self) -> None:
+        self.entries: Dict[str, Signature] = {}
+        self.hits = 0
+        self.misses = 0
+        self._changed: Set[str] = set()
+        self._lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @staticmethod
+    def signature(path: Union[str, Path]) -> Optional[Signature]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    @property
+    def watching(self) -> bool:
+        return self._watcher is not None
+
+    def fresh(self, path: Union[str, Path]) -> bool:
+        key = str(path)
+        if self._watcher is not None:
+            # The watcher stats for us, so a known and unchanged path costs no system call
+            with self._lock:
+                if key in self.entries and key not in self._changed:
+                    self.hits += 1
+                    return True
+        signature = self.signature(key)
+        with self._lock:
+            cached = self.entries.pop(key, None)
+            self._changed.discard(key)
+            if signature is not None:
+                self.entries[key] = signature
+            if signature is not None and signature == cached:
+                self.hits += 1
+                return True
+            self.misses += 1
+            return False
+
+    def invalidate(self, path: Optional[Union[str, Path]] = None) -> None:
+        with self._lock:
+            if path is None:
+                self.entries.clear()
+                self._changed.clear()
+            else:
+                self.entries.pop(str(path), None)
+                self._changed.discard(str(path))
+
+    def watch(self, interval: float = 1.0) -> None:
+        if self._watcher is not None: return
+        with self._lock:
+            self._changed.update(self.entries) # Checked before the watcher started, so verify them once more
+        self._stop.clear()
+        self._watcher = threading.Thread(target=self._poll, args=(interval,), name="Terminal.StatCache", daemon=True)
+        self._watcher.start()
+
+    def unwatch(self) -> None:
+        if self._watcher is None: return
+        self._stop.set()
+        self._watcher.join()
+        self._watcher = None
+
+    def _poll(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            with self._lock:
+                entries = list(self.entries.items())
+            for key, signature in entries:
+                if self.signature(key) != signature:
+                    with self._lock:
+                        self._changed.add(key)
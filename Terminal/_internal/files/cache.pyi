@@ -0,0 +1,42 @@
+from typing import Dict, Optional, Tuple, Union
+from pathlib import Path
+
+Signature = Tuple[int, int, int]
+
+class StatCache:
+    """
+    Remembers the (mtime, size, inode) of paths, so unchanged directories and files can be served from memory.
+    Paths are checked with a single stat, or not at all while a polling watcher runs.
+    """
+    entries: Dict[str, Signature]
+    hits: int
+    misses: int
+
+    def __init__(self) -> None:
+        ...
+
+    @staticmethod
+    def signature(path: Union[str, Path]) -> Optional[Signature]:
+        """The current (mtime, size, inode) of the path, or `None` if it cannot be stat'ed."""
+        ...
+
+    @property
+    def watching(self) -> bool:
+        """Whether the polling watcher runs."""
+        ...
+
+    def fresh(self, path: Union[str, Path]) -> bool:
+        """Whether the path is unchanged since it was last checked. Records its signature either way."""
+        ...
+
+    def invalidate(self, path: Optional[Union[str, Path]] = None) -> None:
+        """Forget the given path, or every path."""
+        ...
+
+    def watch(self, interval: float = 1.0) -> None:
+        """Start a thread that stats the known paths every `interval` seconds and marks the changed ones."""
+        ...
+
+    def unwatch(self) -> None:
+        """Stop the watcher thread."""
+        ...
@@ -1,8 +1,18 @@
-from typing import Iterable, Tuple, List, Optional, TypeVar
+from typing import Any, Callable, Dict, Iterator, Set, Tuple, List, Optional, TypeVar
 from pathlib import Path
 from ..builder import Builder
 from ..core import Terminal
 from .enums import ItemType
+from .view import FileView
+from .cache import StatCache
+from .scanner import DirStats, Scanner
+import bisect
+import os
+
+try:
+    import readline
+except ImportError:
+    readline = None
 
 __all__ = (
     "Item",
@@ -50,13 +60,19 @@ class Item:
     def update(self) -> None:
         raise NotImplementedError
 
+    def refresh(self, cache: Optional[StatCache] = None) -> None:
+        raise NotImplementedError
+
 class File(Item):
     itype = ItemType.FILE
+    eager_size = 1 << 20 # Files up to this size are read whole and kept in `content`
+    encoding = "utf-8"
 
     def __init__(self, path: Path, parent: Optional["Directory"] = None) -> None:
         super().__init__(path, parent)
-        self.content: str = ""
-        self.update()
+        # Nothing is read until the content is asked for
+        self._content: Optional[str] = None
+        self._view: Optional[FileView] = None
 
     @staticmethod
     def check_validity(path: Path) -> bool:
@@ -66,21 +82,88 @@ class File(Item):
     def exists(self) -> bool:
         return self.path.is_file()
 
+    @property
+    def size(self) -> int:
+        return self.path.stat().st_size
+
+    @property
+    def large(self) -> bool:
+        return self.size > self.eager_size
+
+    @property
+    def content(self) -> str:
+        if self._content is not None:
+            return self._content
+        if self.large:
+            return self.view().text() # Decoded on every access, never kept
+        self._content = self.path.read_text(self.encoding, errors="replace")
+        return self._content
+
+    @content.setter
+    def content(self, content: str) -> None:
+        self._content = content
+
     def update(self) -> None:
-        self.content = self.path.read_text()
+        self.close()
+        self._content = None
+        if not self.large:
+            self._content = self.path.read_text(self.encoding, errors="replace")
+
+    def refresh(self, cache: Optional[StatCache] = None) -> None:
+        fresh = cache is not None and cache.fresh(self.path)
+        if fresh and (self._content is not None or self._view is not None):
+            return
+        self.update()
+
+    def view(self) -> FileView:
+        if self._view is None:
+            self._view = FileView(self.path, self.encoding)
+        return self._view
+
+    def read_bytes(self, start: int = 0, end: Optional[int] = None) -> bytes:
+        return self.view().read(start, end)
+
+    def lines(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        if self.large:
+            return self.view().lines(start, stop)
+        # Small files come from their content, so no descriptor or mapping is held for them
+        lines = self.content.split("\n")
+        if lines[-1] == "":
+            lines.pop()
+        return [line.rstrip("\r") for line in lines[start:stop]]
+
+    def count_lines(self) -> int:
+        if self.large:
+            return self.view().count_lines()
+        content = self.content
+        return content.count("\n") + (1 if content and not content.endswith("\n") else 0)
+
+    def stream(self, chunk_size: int = 1 << 16) -> Iterator[str]:
+        with open(self.path, encoding=self.encoding, errors="replace") as file:
+            while chunk := file.read(chunk_size):
+                yield chunk
+
+    def close(self) -> None:
+        if self._view is not None:
+            self._view.close()
+            self._view = None
 
     def write(self, content: str) -> None:
-        self.path.write_text(content)
-        self.content = content
+        self.close()
+        self.path.write_text(content, self.encoding)
+        self._content = None if len(content) > self.eager_size else content
 
 class Directory(Item):
     itype = ItemType.DIRECTORY
 
     def __init__(self, path: Path, parent: Optional["Directory"] = None) -> None:
         super().__init__(path, parent)
-        self.directories: List["Directory"] = []
-        self.files: List[File] = []
-        self.update()
+        # Children are listed on first access, not on construction
+        self._directories: Optional[List["Directory"]] = None
+        self._files: Optional[List[File]] = None
+        # Name lookup, kept in step with the listing on every update
+        self._index: Dict[str, Item] = {}
+        self._names: List[str] = [] # Sorted, for prefix completion
 
     @staticmethod
     def check_validity(path: Path) -> bool:
@@ -90,58 +173,205 @@ class Directory(Item):
     def exists(self) -> bool:
         return self.path.is_dir()
 
+    @property
+    def loaded(self) -> bool:
+        return self._directories is not None and self._files is not None
+
+    @property
+    def directories(self) -> List["Directory"]:
+        if self._directories is None:
+            self.update()
+        return self._directories
+
+    @property
+    def files(self) -> List[File]:
+        if self._files is None:
+            self.update()
+        return self._files
+
     def update(self) -> None:
-        self.load_directories()
-        self.load_files()
+        self._directories, self._files = self._scan()
+        listed = {item.name: item for item in (*self._directories, *self._files)}
+        removed, added = self._index.keys() - listed.keys(), listed.keys() - self._index.keys()
+        if len(removed) + len(added) > 64:
+            self._names = sorted(listed) # Cheaper than inserting one by one, as on the first listing
+        else:
+            for name in removed:
+                del self._names[bisect.bisect_left(self._names, name)]
+            for name in added:
+                bisect.insort(self._names, name)
+        self._index = listed
+
+    def find(self, name: str) -> Optional[Item]:
+        if not self.loaded:
+            self.update()
+        return self._index.get(name)
+
+    def complete(self, prefix: str) -> List[str]:
+        if not self.loaded:
+            self.update()
+        names = []
+        for i in range(bisect.bisect_left(self._names, prefix), len(self._names)):
+            if not self._names[i].startswith(prefix):
+                break
+            names.append(self._names[i])
+        return names
+
+    def refresh(self, cache: Optional[StatCache] = None) -> None:
+        # A directory's mtime changes whenever an entry is added, removed or renamed
+        fresh = cache is not None and cache.fresh(self.path)
+        if fresh and self.loaded:
+            return
+        self.update()
 
-    def walk(self) -> Iterable[Tuple[Path, List[str], List[str]]]:
-        dirs, files = [], []
-        for entry in self.path.iterdir():
-            if entry.is_dir():
-                dirs.append(entry.name)
-            elif entry.is_file():
-                files.append(entry.name)
-        yield self.path, dirs, files
+    def prefetch(self, depth: Optional[int] = 1) -> None:
+        # Lists this directory and `depth - 1` levels below it, or the whole tree for None
+        level = [self]
+        while level and (depth is None or depth > 0):
+            for directory in level:
+                if not directory.loaded:
+                    directory.update()
+            level = [child for directory in level for child in directory.directories]
+            if depth is not None:
+                depth -= 1
+
+    def _scan(self) -> Tuple[List["Directory"], List[File]]:
+        directories, files = [], []
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                # DirEntry answers from the cached d_type, without a stat call per entry
+                known = self._index.get(entry.name) # Unchanged entries keep their item, and whatever it has loaded
+                if entry.is_dir():
+                    directories.append(known if isinstance(known, Directory) else Directory(Path(entry.path), self))
+                elif entry.is_file():
+                    files.append(known if isinstance(known, File) else File(Path(entry.path), self))
+        return directories, files
+
+    def walk(
+        self, 
+        topdown: bool = True, 
+        followlinks: bool = False, 
+        onerror: Optional[Callable[[OSError], Any]] = None, 
+        prune: Optional[Callable[[Path, str], bool]] = None
+    ) -> Iterator[Tuple[Path, List[str], List[str]]]:
+        # Iterative, so memory only grows with the directories still pending, never with the depth of recursion
+        stack: List[Any] = [self.path]
+        while stack:
+            top = stack.pop()
+            if isinstance(top, tuple):
+                yield top # Bottom-up, all of its subdirectories are done
+                continue
+            try:
+                dirs, files, links = self._walk_scan(top, prune)
+            except OSError as error:
+                if onerror is not None:
+                    onerror(error)
+                continue
+            if topdown:
+                yield top, dirs, files # The caller may prune `dirs` in place, as with os.walk
+            else:
+                stack.append((top, dirs, files))
+            stack.extend(top / name for name in reversed(dirs) if followlinks or name not in links)
 
-        for entry in self.path.iterdir():
-            if entry.is_dir():
-                subdir = Directory.load(entry, self)
-                if subdir:
-                    yield from subdir.walk()
+    @staticmethod
+    def _walk_scan(top: Path, prune: Optional[Callable[[Path, str], bool]]) -> Tuple[List[str], List[str], Set[str]]:
+        dirs, files, links = [], [], set()
+        with os.scandir(top) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    files.append(entry.name)
+                    continue
+                if prune is not None and prune(top, entry.name):
+                    continue
+                dirs.append(entry.name)
+                if entry.is_symlink():
+                    links.add(entry.name)
+        return dirs, files, links
 
     def load_directories(self) -> None:
-        self.directories.clear()
-        for entry in self.path.iterdir():
-            if entry.is_dir():
-                directory = Directory.load(entry, self)
-                if directory:
-                    self.directories.append(directory)
+        self.update() # A single scan yields both kinds
 
     def load_files(self) -> None:
-        self.files.clear()
-        for entry in self.path.iterdir():
-            if entry.is_file():
-                file = File.load(entry, self)
-                if file:
-                    self.files.append(file)
+        self.update()
 
 class FileManager:
-    def __init__(self, top: Directory) -> None:
+    def __init__(self, top: Directory, paged: bool = False) -> None:
         self.page = Builder()
         self.top = top
         self.current: Item = top
         self.input_field = Terminal.IOString()
+        self.cache = StatCache()
+        # Only the window of lines starting at `offset` is rendered when paged
+        self.paged = paged
+        self.offset = 0
+
+    def height(self) -> int:
+        try:
+            return max(1, Terminal.get_size()[1] - 3) # Room for the status line, the spacing and the prompt
+        except OSError:
+            return 20
 
     def _render_directory(self) -> None:
-        self.current.update()
-        for directory in getattr(self.current, "directories", []):
+        self.current.refresh(self.cache)
+        directories, files = getattr(self.current, "directories", []), getattr(self.current, "files", [])
+        if not self.paged:
+            for directory in directories:
+                self.page.print(directory.absolute())
+            for file in files:
+                self.page.print(file.absolute())
+            return
+        total = len(directories) + len(files)
+        self.offset = min(self.offset, max(0, total - 1))
+        start, stop = self.offset, self.offset + self.height()
+        for directory in directories[start:stop]:
             self.page.print(directory.absolute())
-        for file in getattr(self.current, "files", []):
+        for file in files[max(0, start - len(directories)):max(0, stop - len(directories))]:
             self.page.print(file.absolute())
+        self.page.print(f"-- {min(start + 1, total)}-{min(stop, total)} of {total} --")
 
     def _render_file(self) -> None:
-        self.current.update()
-        self.page.print(getattr(self.current, "content", ""))
+        self.current.refresh(self.cache)
+        if not self.paged:
+            self.page.print(getattr(self.current, "content", ""))
+            return
+        # Only the visible lines are read, through the file's line offsets
+        lines = self.current.lines(self.offset, self.offset + self.height())
+        if not lines and self.offset:
+            # Scrolled past the end, so stop at the last line like the directory listing does
+            self.offset = max(0, self.current.count_lines() - 1)
+            lines = self.current.lines(self.offset, self.offset + self.height())
+        for line in lines:
+            self.page.print(line)
+        self.page.print(f"-- lines {self.offset + 1}-{self.offset + len(lines)} --")
+
+    def navigate(self, item: Item) -> None:
+        if item is not self.current and self.current.itype == ItemType.FILE:
+            self.current.close() # Its view would otherwise stay mapped as long as the directory keeps the item
+        self.current = item
+        self.offset = 0
+
+    def scroll(self, lines: int) -> None:
+        self.offset = max(0, self.offset + lines)
+
+    def jump(self, line: int) -> None:
+        self.offset = max(0, line - 1)
+
+    def _page_command(self, command: str) -> bool:
+        if command == ":n":
+            self.scroll(self.height())
+        elif command == ":p":
+            self.scroll(-self.height())
+        elif command[:2] in (":+", ":-") and command[2:].isdigit():
+            self.scroll(int(command[1:]))
+        elif command[:1] == ":" and command[1:].isdigit():
+            self.jump(int(command[1:]))
+        else:
+            return False
+        return True
 
     def print(self) -> None:
         self.page.clear()
@@ -151,26 +381,55 @@ class FileManager:
             self._render_file()
         self.page.render(end="")
 
+    def inventory(self, workers: int = 8) -> Dict[Path, DirStats]:
+        directory = self.current if self.current.itype == ItemType.DIRECTORY else self.current.parent or self.top
+
+        def show(stats: DirStats) -> None:
+            Terminal.print(f"{stats.path}  {stats.files} files  {stats.size} bytes", flush=True)
+
+        results = Scanner(workers, callback=show).scan(directory.path)
+        total = results[directory.path]
+        Terminal.print(f"{total.path}  {total.total_files} files  {total.total_size} bytes in total", flush=True)
+        return results
+
+    def find(self, command: str) -> Optional[Item]:
+        if self.current.itype != ItemType.DIRECTORY:
+            return None
+        item = self.current.find(command)
+        if item is None and os.path.isabs(command):
+            path = Path(command)
+            if path.parent == self.current.path.absolute():
+                item = self.current.find(path.name)
+        return item
+
+    def complete(self, text: str, state: int) -> Optional[str]:
+        if self.current.itype != ItemType.DIRECTORY:
+            return None
+        candidates = self.current.complete(text)
+        return candidates[state] if state < len(candidates) else None
+
     def input(self) -> Optional[str]:
         Terminal.space()
         self.input_field.clear()
+        if readline is not None:
+            readline.set_completer(self.complete)
+            readline.parse_and_bind("tab: complete")
         self.input_field.input(f"{self.current.absolute()}>")
         command = self.input_field.value.strip()
 
+        # Scroll the page
+        if self.paged and self._page_command(command):
+            return None
+
         # Navigate to parent
         if command == "..":
-            self.current = self.current.parent or self.current.load_parent() or self.top
+            self.navigate(self.current.parent or self.current.load_parent() or self.top)
             return None
 
         # Navigate inside directory
-        if self.current.itype == ItemType.DIRECTORY:
-            for directory in self.current.directories:
-                if command in (directory.absolute(), directory.name):
-                    self.current = directory
-                    return None
-            for file in self.current.files:
-                if command in (file.absolute(), file.name):
-                    self.current = file
-                    return None
+        item = self.find(command)
+        if item is not None:
+            self.navigate(item)
+            return None
 
         return command
\ No newline at end of file
@@ -1,8 +1,11 @@
-from typing import Iterable, Tuple, List, Optional, Protocol, Self
+from typing import Any, Callable, Dict, Iterable, Iterator, Tuple, List, Optional, Protocol, Self
 from pathlib import Path
 from ..builder import Builder
 from ..core import Terminal
 from .enums import ItemType
+from .view import FileView
+from .cache import StatCache
+from .scanner import DirStats
 
 class Item(Protocol):
     itype: ItemType
@@ -40,8 +43,18 @@ class Item(Protocol):
     
     def update(self) -> None:
         ...
+    
+    def refresh(self, cache: Optional[StatCache] = None) -> None:
+        """Update, unless the cache confirms nothing changed since the last refresh."""
+        ...
 
 class File(Item):
+    """
+    A file. Its content is read lazily.
+    Files up to `eager_size` bytes are read whole and cached, larger files are accessed through a memory-mapped view.
+    """
+    eager_size: int
+    encoding: str
     content: str
 
     def __init__(self, path: Path, parent: Optional["Directory"] = None) -> None:
@@ -55,13 +68,52 @@ class File(Item):
     def exists(self) -> bool:
         ...
     
+    @property
+    def size(self) -> int:
+        """The size in bytes."""
+        ...
+    
+    @property
+    def large(self) -> bool:
+        """Whether the file is larger than `eager_size`."""
+        ...
+    
     def update(self) -> None:
+        """Drop what was read. Small files are read again right away."""
+        ...
+    
+    def view(self) -> FileView:
+        """The memory-mapped view of this file."""
+        ...
+    
+    def read_bytes(self, start: int = 0, end: Optional[int] = None) -> bytes:
+        """Read a byte range without loading the rest of the file."""
+        ...
+    
+    def lines(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """
+        Read a range of lines without loading the rest of the file. 
+        Files up to `eager_size` are split from their content, larger ones are read through their view.
+        """
+        ...
+    
+    def count_lines(self) -> int:
+        """The number of lines in the file. Large files are indexed to the end for it."""
+        ...
+    
+    def stream(self, chunk_size: int = 65536) -> Iterator[str]:
+        """Read the file as text, chunk by chunk."""
+        ...
+    
+    def close(self) -> None:
+        """Release the memory-mapped view, if any."""
         ...
     
     def write(self, content: str) -> None:
         ...
 
 class Directory(Item):
+    """A directory. Its children are listed with `os.scandir` on first access."""
     directories: List["Directory"]
     files: List[File]
 
@@ -76,11 +128,40 @@ class Directory(Item):
     def exists(self) -> bool:
         ...
     
+    @property
+    def loaded(self) -> bool:
+        """Whether the children have been listed."""
+        ...
+    
     def update(self) -> None:
+        """List the children again. Entries that are still there keep their item."""
+        ...
+    
+    def find(self, name: str) -> Optional[Item]:
+        """Return the child called `name`, or None."""
         ...
     
-    def walk(self) -> Iterable[Tuple[Path, List[str], List[str]]]:
-        """Recursively yield (directory path, subdirectory names, file names)"""
+    def complete(self, prefix: str) -> List[str]:
+        """Return the names of all children starting with `prefix`, sorted."""
+        ...
+    
+    def prefetch(self, depth: Optional[int] = 1) -> None:
+        """List this directory and `depth - 1` levels below it ahead of time. `None` lists the whole tree."""
+        ...
+    
+    def walk(
+        self, 
+        topdown: bool = True, 
+        followlinks: bool = False, 
+        onerror: Optional[Callable[[OSError], Any]] = None, 
+        prune: Optional[Callable[[Path, str], bool]] = None
+    ) -> Iterator[Tuple[Path, List[str], List[str]]]:
+        """
+        Recursively yield (directory path, subdirectory names, file names), like `os.walk`. 
+        Every directory is listed once with `os.scandir` and no file is read. 
+        `prune(parent, name)` returning True skips that subdirectory, and with `topdown` 
+        removing names from the yielded subdirectory list skips them as well.
+        """
         ...
     
     def load_directories(self) -> None:
@@ -95,14 +176,50 @@ class FileManager:
     top: Directory
 
     input_field: Terminal.IOString
+    cache: StatCache
+    paged: bool
+    offset: int
+    
+    def __init__(self, top: Directory, paged: bool = False) -> None:
+        """
+        When `paged`, only one terminal height of lines, starting at `offset`, is rendered. 
+        The commands `:n` and `:p` turn the page, `:+N` and `:-N` scroll and `:N` jumps to line N. 
+        Scrolling stops at the last line.
+        """
+        ...
+    
+    def height(self) -> int:
+        """The number of lines in one page."""
+        ...
     
-    def __init__(self, top: Directory) -> None:
+    def navigate(self, item: Item) -> None:
+        """Make `item` the current item, closing the view of the file left behind."""
+        ...
+    
+    def scroll(self, lines: int) -> None:
+        """Move the page by `lines`, negative to go back."""
+        ...
+    
+    def jump(self, line: int) -> None:
+        """Move the page to start at `line`, counting from 1."""
         ...
     
     def print(self) -> None:
         """Print all directories and files onto the screen."""
         ...
     
+    def inventory(self, workers: int = 8) -> Dict[Path, DirStats]:
+        """Scan the current directory tree in parallel, printing each directory's stats as they arrive."""
+        ...
+    
+    def find(self, command: str) -> Optional[Item]:
+        """Resolve a name, or an absolute path, to a child of the current directory."""
+        ...
+    
+    def complete(self, text: str, state: int) -> Optional[str]:
+        """A readline completer over the names in the current directory."""
+        ...
+    
     def input(self) -> Optional[str]:
-        """Ask user for a input."""
+        """Ask user for a input. Tab completes names where readline is available."""
         ...
\ No newline at end of file
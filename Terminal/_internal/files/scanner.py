@@ -0,0 +1,93 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+import os
+
+__all__ = ("DirStats", "Scanner")
+
+class DirStats:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        # Entries directly inside this directory
+        self.files = 0
+        self.size = 0
+        self.newest = 0.0
+        # Including every subdirectory, filled in once the scan completes
+        self.total_files = 0
+        self.total_size = 0
+        self.total_newest = 0.0
+
+    def __repr__(self) -> str:
+        return f"DirStats({str(self.path)!r}, files={self.files}, size={self.size}, total_files={self.total_files}, total_size={self.total_size})"
+
+class Scanner:
+    def __init__(
+        self, 
+        workers: int = 8, 
+        *, 
+        followlinks: bool = False, 
+        callback: Optional[Callable[[DirStats], Any]] = None, 
+        onerror: Optional[Callable[[OSError], Any]] = None
+    ) -> None:
+        self.workers = workers
+        self.followlinks = followlinks
+        self.callback = callback
+        self.onerror = onerror
+
+    def scan(self, root: Path) -> Dict[Path, DirStats]:
+        results: Dict[Path, DirStats] = {}
+        with ThreadPoolExecutor(self.workers) as pool:
+            pending = {pool.submit(self._scan_directory, Path(root))}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stats, subdirectories = future.result()
+                    results[stats.path] = stats
+                    if self.callback is not None:
+                        self.callback(stats) # Runs on the calling thread, so it may print freely
+                    pending.update(pool.submit(self._scan_directory, path) for path in subdirectories)
+        self._roll_up(results)
+        return results
+
+    def _scan_directory(self, path: Path) -> Tuple[DirStats, List[Path]]:
+        stats = DirStats(path)
+        subdirectories = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=self.followlinks):
+                            subdirectories.append(Path(entry.path))
+                            continue
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                    except OSError as error:
+                        self._error(error)
+                        continue
+                    stats.files += 1
+                    stats.size += stat.st_size
+                    stats.newest = max(stats.newest, stat.st_mtime)
+        except OSError as error:
+            self._error(error)
+        return stats, subdirectories
+
+    def _error(self, error: OSError) -> None:
+        if self.onerror is not None:
+            self.onerror(error)
+
+    @staticmethod
+    def _roll_up(results: Dict[Path, DirStats]) -> None:
+        for stats in results.values():
+            stats.total_files = stats.files
+            stats.total_size = stats.size
+            stats.total_newest = stats.newest
+        # Deepest first, so every directory is complete before it is added to its parent
+        for path in sorted(results, key=lambda path: len(path.parts), reverse=True):
+            parent = results.get(path.parent)
+            if parent is None or parent is results[path]:
+                continue
+            stats = results[path]
+            parent.total_files += stats.total_files
+            parent.total_size += stats.total_size
+            parent.total_newest = max(parent.total_newest, stats.total_newest)
@@ -0,0 +1,43 @@
+from typing import Any, Callable, Dict, Optional
+from pathlib import Path
+
+class DirStats:
+    """
+    Aggregates of one directory. 
+    `files`, `size` and `newest` cover the files directly inside it, 
+    the `total_` variants include every subdirectory once the scan completes.
+    """
+    path: Path
+    files: int
+    size: int
+    newest: float
+    total_files: int
+    total_size: int
+    total_newest: float
+
+    def __init__(self, path: Path) -> None:
+        ...
+
+class Scanner:
+    """Scans a directory tree, listing subdirectories in parallel on a thread pool."""
+    workers: int
+    followlinks: bool
+    callback: Optional[Callable[[DirStats], Any]]
+    onerror: Optional[Callable[[OSError], Any]]
+
+    def __init__(
+        self, 
+        workers: int = 8, 
+        *, 
+        followlinks: bool = False, 
+        callback: Optional[Callable[[DirStats], Any]] = None, 
+        onerror: Optional[Callable[[OSError], Any]] = None
+    ) -> None:
+        ...
+
+    def scan(self, root: Path) -> Dict[Path, DirStats]:
+        """
+        Scan the tree below `root` and return the stats of every directory. 
+        `callback` receives each directory's own stats on the calling thread as soon as it is listed.
+        """
+        ...
@@ -0,0 +1,101 @@
+from typing import Iterator, List, Optional
+from pathlib import Path
+import mmap
+import os
+
+__all__ = ("FileView",)
+
+class FileView:
+    checkpoint = 1024 # Only the offset of every n-th line is kept, lines in between are found on demand
+
+    def __init__(self, path: Path, encoding: str = "utf-8") -> None:
+        self.path = path
+        self.encoding = encoding
+        self._file = open(path, "rb")
+        self.size = os.fstat(self._file.fileno()).st_size
+        # Empty files cannot be mapped
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        self._offsets = [0]
+        self._indexed = self.size == 0
+
+    def __enter__(self) -> "FileView":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def read(self, start: int = 0, end: Optional[int] = None) -> bytes:
+        if self._map is None:
+            return b""
+        return self._map[start:end]
+
+    def text(self, start: int = 0, end: Optional[int] = None) -> str:
+        return self.read(start, end).decode(self.encoding, errors="replace")
+
+    def line_offset(self, line: int) -> Optional[int]:
+        block, rest = divmod(line, self.checkpoint)
+        self._index(block)
+        if block >= len(self._offsets):
+            return None
+        position = self._offsets[block]
+        for _ in range(rest):
+            position = self._next_line(position)
+            if position is None:
+                return None
+        return position if position < self.size or line == 0 else None
+
+    def lines(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        position = self.line_offset(start)
+        lines = []
+        while position is not None and position < self.size and (stop is None or start + len(lines) < stop):
+            end = self._map.find(b"\n", position)
+            end = self.size if end == -1 else end
+            lines.append(self.text(position, end).rstrip("\r"))
+            position = end + 1
+        return lines
+
+    def count_lines(self) -> int:
+        # Indexes the whole file, the only call that has to scan all of it
+        self._index(None)
+        count = (len(self._offsets) - 1) * self.checkpoint
+        position = self._offsets[-1]
+        while position is not None and position < self.size:
+            count += 1
+            position = self._next_line(position)
+        return count
+
+    def chunks(self, size: int = 1 << 16) -> Iterator[bytes]:
+        for start in range(0, self.size, size):
+            yield self.read(start, start + size)
+
+    def _next_line(self, position: int) -> Optional[int]:
+        end = self._map.find(b"\n", position)
+        return None if end == -1 else end + 1
+
+    def _index(self, block: Optional[int]) -> None:
+        while not self._indexed and (block is None or len(self._offsets) <= block):
+            position = self._skip_lines(self._offsets[-1], self.checkpoint)
+            if position is None or position >= self.size:
+                self._indexed = True
+            else:
+                self._offsets.append(position)
+
+    def _skip_lines(self, position: int, count: int) -> Optional[int]:
+        # Counts newlines a chunk at a time, so the search stays in C instead of a call per line
+        while position < self.size:
+            chunk = self._map[position:position + (1 << 16)]
+            found = chunk.count(b"\n")
+            if found >= count:
+                return position + len(chunk) - len(chunk.split(b"\n", count)[-1])
+            count -= found
+            position += len(chunk)
+        return None
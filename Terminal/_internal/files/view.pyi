@@ -0,0 +1,52 @@
+from typing import Iterator, List, Optional
+from pathlib import Path
+
+class FileView:
+    """
+    Memory-mapped, read-only view of a file.
+    Lines are located by scanning for newlines on demand, keeping the offset of every `checkpoint`-th line.
+    """
+    checkpoint: int
+    path: Path
+    encoding: str
+    size: int
+
+    def __init__(self, path: Path, encoding: str = "utf-8") -> None:
+        ...
+
+    def __enter__(self) -> "FileView":
+        ...
+
+    def __exit__(self, *args) -> None:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        ...
+
+    def read(self, start: int = 0, end: Optional[int] = None) -> bytes:
+        """Read a byte range."""
+        ...
+
+    def text(self, start: int = 0, end: Optional[int] = None) -> str:
+        """Read a byte range as text."""
+        ...
+
+    def line_offset(self, line: int) -> Optional[int]:
+        """The byte offset where the given line starts, or `None` past the end."""
+        ...
+
+    def lines(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """Read the lines from `start` up to `stop`, without line endings."""
+        ...
+
+    def count_lines(self) -> int:
+        """Count all lines. Scans the whole file once."""
+        ...
+
+    def chunks(self, size: int = 65536) -> Iterator[bytes]:
+        """Iterate over the file in chunks of bytes."""
+        ...
@@ -1,7 +1,14 @@
-from typing import List, Optional, Type, Protocol
+from typing import Any, Awaitable, Callable, List, Optional, Tuple, Type, Protocol
+from collections import deque
+from contextlib import contextmanager
 from .builder import Builder
-from .core import Terminal
-from .tools import Utils
+from .core import Terminal, Output
+from .tools import Utils, AnsiCursor
+import threading
+import asyncio
+import inspect
+import heapq
+import time
 import sys
 
 __all__ = (
@@ -11,7 +18,11 @@ __all__ = (
     "MenuPage",
     "PageRegistry",
     "Manager",
+    "Renderer",
+    "Timer",
+    "FrameStats",
     "Application",
+    "AsyncApplication",
 )
 
 class Page(Protocol):
@@ -112,34 +123,397 @@ class Manager:
         if not page: return
         self.app.init_page(page)
 
+class Renderer:
+    def __init__(self) -> None:
+        self.screen: List[str] = [] # What each row of the terminal currently shows
+        self.lines: List[str] = [] # Completed rows of the frame being rendered
+        self.partial = ""
+        self.pending: List[str] = []
+        self.size: Optional[Tuple[int, int]] = None
+        self.valid = False
+        self.overflow = False # The frame outgrew the terminal and is written top to bottom instead
+        self.streamed = 0 # Characters of the open row already written while overflowing
+        self._target = None
+    
+    def invalidate(self) -> None:
+        self.valid = False
+    
+    @contextmanager
+    def frame(self):
+        self.begin()
+        try:
+            yield
+        finally:
+            self.end()
+    
+    def begin(self) -> None:
+        Output.flush() # Nothing from before the frame may end up inside it
+        try:
+            size = tuple(Terminal.get_size())
+        except OSError:
+            size = None
+        out = []
+        if not self.valid or size != self.size:
+            out.append(AnsiCursor.erase_screen() + AnsiCursor.erase_home())
+            self.screen = []
+            self.size = size
+            self.valid = True
+        self.lines = []
+        self.partial = ""
+        self.pending = []
+        self.overflow = False
+        self.streamed = 0
+        self._emit(out)
+        self._target, Output.target = Output.target, self
+    
+    def end(self) -> None:
+        Output.flush()
+        Output.target = self._target
+        self._target = None
+        out = self._commit()
+        if self.overflow:
+            self._emit(out)
+            return
+        rows = len(self.lines) + (1 if self.partial else 0)
+        for row in range(rows, len(self.screen)):
+            out.append(AnsiCursor.cursor_to(row + 1, 1) + AnsiCursor.erase_line())
+        del self.screen[rows:]
+        if not self.partial:
+            out.append(AnsiCursor.cursor_to(rows + 1, 1))
+        self._emit(out)
+    
+    def write(self, text: str) -> None:
+        self.pending.append(text)
+    
+    def flush(self) -> None:
+        out = self._commit()
+        if self.partial and not self.overflow:
+            # Redraw the open row even when unchanged, so the cursor ends right after it
+            out.append(AnsiCursor.cursor_to(len(self.lines) + 1, 1) + AnsiCursor.erase_line() + self.partial)
+        self._emit(out)
+    
+    def echo(self, text: str) -> None:
+        # The terminal echoed the input and moved to the next row by itself
+        line = self.partial + text
+        if not self.overflow:
+            self._show(len(self.lines), line)
+        self.lines.append(line)
+        self.partial = ""
+        self.streamed = 0
+        if not self.overflow and not self._fits(len(self.lines), ""):
+            self._spill() # Echoing on the last row scrolled the screen, nothing is where we left it
+    
+    def _commit(self) -> List[str]:
+        out = []
+        *complete, self.partial = (self.partial + "".join(self.pending)).split("\n")
+        self.pending = []
+        for line in complete:
+            out.extend(self._draw(len(self.lines), line, complete=True))
+            self.lines.append(line)
+        if self.partial:
+            out.extend(self._draw(len(self.lines), self.partial))
+        return out
+    
+    def _draw(self, row: int, line: str, complete: bool = False) -> List[str]:
+        if not self.overflow and not self._fits(row, line):
+            # Rows past the bottom or wrapped onto the next one cannot be addressed, so the frame is repainted whole
+            self._spill()
+            repaint = AnsiCursor.erase_screen() + AnsiCursor.erase_home() + "".join(done + "\n" for done in self.lines)
+            return [repaint] + self._draw(row, line, complete)
+        if self.overflow:
+            text = line[self.streamed:] + ("\n" if complete else "")
+            self.streamed = 0 if complete else len(line)
+            return [text]
+        if row < len(self.screen) and self.screen[row] == line:
+            return []
+        self._show(row, line)
+        return [AnsiCursor.cursor_to(row + 1, 1) + AnsiCursor.erase_line() + line]
+    
+    def _fits(self, row: int, line: str) -> bool:
+        if self.size is None:
+            return True
+        columns, rows = self.size
+        return row < rows and len(Terminal.strip_ansi(line)) <= columns
+    
+    def _spill(self) -> None:
+        self.overflow = True
+        self.valid = False # The next frame starts over with a full repaint
+        self.screen = []
+        self.streamed = 0
+    
+    def _show(self, row: int, line: str) -> None:
+        if row < len(self.screen):
+            self.screen[row] = line
+        else:
+            self.screen.extend([""] * (row - len(self.screen)) + [line])
+    
+    def _emit(self, out: List[str]) -> None:
+        if not out or Terminal.blocking: return
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+
+class Timer:
+    def __init__(self, due: float, callback: Callable[[], Any], interval: Optional[float] = None) -> None:
+        self.due = due
+        self.callback = callback
+        self.interval = interval
+        self.cancelled = False
+    
+    def cancel(self) -> None:
+        self.cancelled = True
+    
+    def __lt__(self, other: "Timer") -> bool:
+        return self.due < other.due
+
+class FrameStats:
+    smoothing = 0.1
+
+    def __init__(self) -> None:
+        self.frames = 0
+        self.last = 0.0
+        self.average = 0.0
+        self.worst = 0.0
+        self.rate = 0.0
+        self._started = None
+    
+    def record(self, started: float, duration: float) -> None:
+        if self._started is not None and started > self._started:
+            rate = 1 / (started - self._started)
+            self.rate = rate if not self.rate else self.rate + (rate - self.rate) * self.smoothing
+        self._started = started
+        self.frames += 1
+        self.last = duration
+        self.average = duration if self.frames == 1 else self.average + (duration - self.average) * self.smoothing
+        self.worst = max(self.worst, duration)
+
 class Application:
     def __init__(self) -> None:
         self.active = False
         self.manager = Manager(self)
         self.page = None
         self.clear = True
+        self.renderer = Renderer()
+        self.fps = 30
+        self.dirty = True
+        self.stats = FrameStats()
+        self._timers: List[Timer] = []
+        self._deferred = deque()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._next_frame = 0.0
     
     def init_page(self, page: Page) -> None:
         self.page = page
+        self.renderer.invalidate()
         page.init(self)
+        self.mark_dirty()
+    
+    def mark_dirty(self) -> None:
+        self.dirty = True
+        self._wake.set()
+    
+    def schedule(self, callback: Callable[[], Any], delay: float = 0, interval: Optional[float] = None) -> Timer:
+        timer = Timer(time.monotonic() + delay, callback, interval)
+        with self._lock:
+            heapq.heappush(self._timers, timer)
+        self._wake.set()
+        return timer
+    
+    def call_soon(self, callback: Callable[[], Any]) -> None:
+        self._deferred.append(callback)
+        self._wake.set()
     
     def init(self, name: str) -> None:
         self.manager.init(name)
     
+    def invalidate(self) -> None:
+        self.renderer.invalidate()
+    
     def render(self) -> None:
-        if self.clear:
-            Terminal.clear()
-        if self.page: 
-            self.page.render()
+        if not self.clear:
+            if self.page:
+                self.page.render()
+            return
+        with self.renderer.frame():
+            if self.page: 
+                self.page.render()
     
     def start(self) -> None:
         self.active = True
+        self.mark_dirty()
         while self.active:
-            self.render()
+            self.tick()
         sys.exit(0) # Automatically deinitializes the Terminal
     
+    def tick(self) -> None:
+        self._run_callbacks()
+        if not self.active: return
+        if self._frame_due():
+            frame = self._begin_frame()
+            self.render()
+            self._end_frame(*frame)
+            return
+        self._wake.wait(self._timeout())
+    
+    def _frame_due(self) -> bool:
+        return self.dirty and time.monotonic() >= self._next_frame
+    
+    def _begin_frame(self) -> Tuple[float, int]:
+        self.dirty = False
+        return time.monotonic(), Output.reads
+    
+    def _end_frame(self, started: float, reads: int) -> None:
+        finished = time.monotonic()
+        self.stats.record(started, finished - started)
+        self._next_frame = started + 1 / self.fps if self.fps else finished
+        if Output.reads != reads:
+            self.dirty = True # The page consumed input, so its state has likely changed
+    
+    def _run_callbacks(self) -> None:
+        while self._deferred:
+            self._deferred.popleft()()
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                if not self._timers or self._timers[0].due > now:
+                    return
+                timer = heapq.heappop(self._timers)
+            if timer.cancelled: continue
+            timer.callback()
+            if timer.interval is not None and not timer.cancelled:
+                timer.due = max(timer.due + timer.interval, now)
+                with self._lock:
+                    heapq.heappush(self._timers, timer)
+    
+    def _timeout(self) -> Optional[float]:
+        self._wake.clear()
+        if self._deferred: return 0.0
+        deadline = self._next_frame if self.dirty else None
+        with self._lock:
+            if self._timers:
+                deadline = self._timers[0].due if deadline is None else min(deadline, self._timers[0].due)
+        return None if deadline is None else max(0.0, deadline - time.monotonic())
+    
     def quit(self) -> None:
         self.active = False
+        self._wake.set()
+
+class _AsyncWake:
+    def __init__(self) -> None:
+        self.loop = None
+        self.event = None
+    
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.event = asyncio.Event()
+    
+    def set(self) -> None:
+        if self.loop is None: return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            self.event.set()
+        elif not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.event.set)
+    
+    def clear(self) -> None:
+        if self.event is not None:
+            self.event.clear()
+    
+    async def wait(self, timeout: Optional[float]) -> None:
+        try:
+            await asyncio.wait_for(self.event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+class AsyncApplication(Application):
+    def __init__(self) -> None:
+        super().__init__()
+        self.loop = None
+        self._wake = _AsyncWake()
+        self._pending: List[Awaitable[Any]] = []
+    
+    def schedule(self, callback: Callable[[], Any], delay: float = 0, interval: Optional[float] = None) -> Timer:
+        timer = Timer(time.monotonic() + delay, callback, interval)
+        if self.loop is None:
+            with self._lock:
+                heapq.heappush(self._timers, timer) # Armed once the loop starts
+        else:
+            self.loop.call_soon_threadsafe(self._arm, timer)
+        return timer
+    
+    def call_soon(self, callback: Callable[[], Any]) -> None:
+        if self.loop is None:
+            self._deferred.append(callback)
+        else:
+            self.loop.call_soon_threadsafe(self._call, callback)
+    
+    def spawn(self, awaitable: Awaitable[Any]) -> None:
+        if self.loop is None:
+            self._pending.append(awaitable)
+        else:
+            asyncio.ensure_future(awaitable, loop=self.loop)
+    
+    async def arender(self) -> None:
+        if not self.clear:
+            await self._render_page()
+            return
+        with self.renderer.frame():
+            await self._render_page()
+    
+    async def start(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self._wake.bind(self.loop)
+        self.active = True
+        with self._lock:
+            timers, self._timers = self._timers, []
+        for timer in timers:
+            self._arm(timer)
+        while self._deferred:
+            self.loop.call_soon(self._call, self._deferred.popleft())
+        for awaitable in self._pending:
+            asyncio.ensure_future(awaitable)
+        self._pending.clear()
+        self.mark_dirty()
+        try:
+            while self.active:
+                if self._frame_due():
+                    frame = self._begin_frame()
+                    await self.arender()
+                    self._end_frame(*frame)
+                    await asyncio.sleep(0) # Never starve the other tasks, even without an fps cap
+                    continue
+                self._wake.clear()
+                await self._wake.wait(max(0.0, self._next_frame - time.monotonic()) if self.dirty else None)
+        finally:
+            self.loop = None
+    
+    def run(self) -> None:
+        asyncio.run(self.start())
+        sys.exit(0) # Automatically deinitializes the Terminal
+    
+    async def _render_page(self) -> None:
+        if not self.page: return
+        result = self.page.render()
+        if inspect.isawaitable(result):
+            await result
+    
+    def _arm(self, timer: Timer) -> None:
+        self.loop.call_later(max(0.0, timer.due - time.monotonic()), self._fire, timer)
+    
+    def _fire(self, timer: Timer) -> None:
+        if timer.cancelled or not self.active: return
+        self._call(timer.callback)
+        if timer.interval is not None and not timer.cancelled:
+            timer.due = max(timer.due + timer.interval, time.monotonic())
+            self._arm(timer)
+    
+    def _call(self, callback: Callable[[], Any]) -> None:
+        result = callback()
+        if inspect.isawaitable(result):
+            asyncio.ensure_future(result)
 
 class Public:
     Page = Page
@@ -147,4 +521,8 @@ class Public:
     MenuPage = MenuPage
     PageRegistry = PageRegistry
     Manager = Manager
-    Application = Application
\ No newline at end of file
+    Renderer = Renderer
+    Timer = Timer
+    FrameStats = FrameStats
+    Application = Application
+    AsyncApplication = AsyncApplication
\ No newline at end of file
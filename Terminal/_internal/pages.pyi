@@ -2,7 +2,9 @@
 The pages will allow you to make the application adaptive, modular, and dynamic.
 """
 
-from typing import List, Dict, Optional, Type, Protocol 
+from typing import Any, Awaitable, Callable, List, Dict, Optional, Tuple, Type, Protocol, Union
+import asyncio
+from contextlib import AbstractContextManager
 from .builder import Builder
 
 class Page(Protocol):
@@ -29,8 +31,8 @@ class Page(Protocol):
     def _load_children(self) -> None: 
         ...
 
-    def render(self) -> None: 
-        """Render the page content."""
+    def render(self) -> Union[None, Awaitable[None]]: 
+        """Render the page content. May be a coroutine when used by an `AsyncApplication`."""
         ...
 
     @classmethod
@@ -103,12 +105,95 @@ class Manager:
         """Initialize the page with the given name."""
         ...
 
+class Renderer:
+    """
+    Double-buffered screen renderer. 
+    Output written during a frame is captured and compared with the previous frame line by line, 
+    and only the rows that changed are redrawn. The screen is repainted fully on resize or after `invalidate`. 
+    A frame taller than the terminal, or with rows wider than it, is repainted whole and written top to bottom, 
+    so the terminal scrolls it instead of rows being drawn off screen.
+    """
+    screen: List[str]
+    lines: List[str]
+    partial: str
+    pending: List[str]
+    size: Optional[Tuple[int, int]]
+    valid: bool
+    overflow: bool
+    streamed: int
+
+    def __init__(self) -> None:
+        ...
+
+    def invalidate(self) -> None:
+        """Force a full repaint on the next frame."""
+        ...
+
+    def frame(self) -> AbstractContextManager[None]:
+        """Capture all terminal output inside the context as one frame."""
+        ...
+
+    def begin(self) -> None:
+        """Start capturing a frame. [See `frame`]"""
+        ...
+
+    def end(self) -> None:
+        """Draw the changed rows of the captured frame. [See `frame`]"""
+        ...
+
+    def write(self, text: str) -> None:
+        ...
+
+    def flush(self) -> None:
+        """Draw everything captured so far, e.g. before the page reads input."""
+        ...
+
+    def echo(self, text: str) -> None:
+        ...
+
+class Timer:
+    """A callback registered on the application, run once or every `interval` seconds."""
+    due: float
+    callback: Callable[[], Any]
+    interval: Optional[float]
+    cancelled: bool
+
+    def __init__(self, due: float, callback: Callable[[], Any], interval: Optional[float] = None) -> None:
+        ...
+
+    def cancel(self) -> None:
+        """Stop this timer from running again."""
+        ...
+
+    def __lt__(self, other: "Timer") -> bool:
+        ...
+
+class FrameStats:
+    """Timing of the rendered frames. Averages are smoothed over recent frames."""
+    smoothing: float
+    frames: int
+    last: float
+    average: float
+    worst: float
+    rate: float
+
+    def __init__(self) -> None:
+        ...
+
+    def record(self, started: float, duration: float) -> None:
+        """Record a frame that started at `started` and took `duration` seconds."""
+        ...
+
 class Application:
     """The main application class that uses pages to structure its content."""
     active: bool
     manager: Manager
     page: Optional[Page]
     clear: bool
+    renderer: Renderer
+    fps: float
+    dirty: bool
+    stats: FrameStats
 
     def __init__(self) -> None:
         ...
@@ -117,22 +202,72 @@ class Application:
         """Initialize the given page as the current page."""
         ...
 
+    def mark_dirty(self) -> None:
+        """Request a new frame. Safe to call from other threads."""
+        ...
+
+    def schedule(self, callback: Callable[[], Any], delay: float = 0, interval: Optional[float] = None) -> Timer:
+        """Run the callback after `delay` seconds, and then every `interval` seconds if given."""
+        ...
+
+    def call_soon(self, callback: Callable[[], Any]) -> None:
+        """Run the callback on the application loop before the next frame."""
+        ...
+
     def init(self, name: str) -> None:
         """Initialize the application with the page of the given name."""
         ...
 
+    def invalidate(self) -> None:
+        """Repaint the whole screen on the next render."""
+        ...
+
     def render(self) -> None:
-        """Render the current page."""
+        """Render the current page. With `clear`, only the rows that changed since the last render are redrawn."""
         ...
 
     def start(self) -> None:
-        """Start the application loop."""
+        """
+        Start the application loop. 
+        A frame is rendered only while the application is dirty, at most `fps` times a second. 
+        The loop sleeps until the next timer, callback or `mark_dirty` otherwise.
+        """
+        ...
+
+    def tick(self) -> None:
+        """Run one iteration of the application loop."""
         ...
 
     def quit(self) -> None:
         """Quit the application."""
         ...
 
+class AsyncApplication(Application):
+    """
+    An application that runs on an asyncio event loop. 
+    Pages may render with coroutines, and rendering, `Terminal.ainput` and your own tasks share the loop.
+    """
+    loop: Optional[asyncio.AbstractEventLoop]
+
+    def __init__(self) -> None:
+        ...
+
+    def spawn(self, awaitable: Awaitable[Any]) -> None:
+        """Run the awaitable as a task on the application loop."""
+        ...
+
+    async def arender(self) -> None:
+        """Render the current page, awaiting it if its render is a coroutine."""
+        ...
+
+    async def start(self) -> None:  # type: ignore[override]
+        """Run the application loop on the running event loop until `quit`."""
+        ...
+
+    def run(self) -> None:
+        """Start the application on a new event loop."""
+        ...
+
 class Public:
     """
     The pages will allow you to make the application adaptive, modular, and dynamic.
@@ -142,4 +277,8 @@ class Public:
     MenuPage: Type["MenuPage"]
     PageRegistry: Type["PageRegistry"]
     Manager: Type["Manager"]
-    Application: Type["Application"]
\ No newline at end of file
+    Renderer: Type["Renderer"]
+    Timer: Type["Timer"]
+    FrameStats: Type["FrameStats"]
+    Application: Type["Application"]
+    AsyncApplication: Type["AsyncApplication"]
\ No newline at end of file
@@ -0,0 +1,132 @@
+from typing import Any, List, Tuple
+from functools import lru_cache
+from .enums import ColorLevel
+import os
+
+__all__ = ("Fore", "Back", "Style", "supports_vt", "detect_level", "index_256", "index_16", "rgb")
+
+# Literal SGR sequences, with the same names as colorama's, so the color keys never need colorama itself
+class Fore:
+    BLACK = "\033[30m"
+    RED = "\033[31m"
+    GREEN = "\033[32m"
+    YELLOW = "\033[33m"
+    BLUE = "\033[34m"
+    MAGENTA = "\033[35m"
+    CYAN = "\033[36m"
+    WHITE = "\033[37m"
+    RESET = "\033[39m"
+    LIGHTBLACK_EX = "\033[90m"
+    LIGHTRED_EX = "\033[91m"
+    LIGHTGREEN_EX = "\033[92m"
+    LIGHTYELLOW_EX = "\033[93m"
+    LIGHTBLUE_EX = "\033[94m"
+    LIGHTMAGENTA_EX = "\033[95m"
+    LIGHTCYAN_EX = "\033[96m"
+    LIGHTWHITE_EX = "\033[97m"
+
+class Back:
+    BLACK = "\033[40m"
+    RED = "\033[41m"
+    GREEN = "\033[42m"
+    YELLOW = "\033[43m"
+    BLUE = "\033[44m"
+    MAGENTA = "\033[45m"
+    CYAN = "\033[46m"
+    WHITE = "\033[47m"
+    RESET = "\033[49m"
+    LIGHTBLACK_EX = "\033[100m"
+    LIGHTRED_EX = "\033[101m"
+    LIGHTGREEN_EX = "\033[102m"
+    LIGHTYELLOW_EX = "\033[103m"
+    LIGHTBLUE_EX = "\033[104m"
+    LIGHTMAGENTA_EX = "\033[105m"
+    LIGHTCYAN_EX = "\033[106m"
+    LIGHTWHITE_EX = "\033[107m"
+
+class Style:
+    BRIGHT = "\033[1m"
+    DIM = "\033[2m"
+    NORMAL = "\033[22m"
+    RESET_ALL = "\033[0m"
+
+def supports_vt(stream: Any) -> bool:
+    # Anything but a terminal, such as a pipe or a file, gets its sequences stripped by colorama instead
+    try:
+        if not stream.isatty():
+            return False
+    except (AttributeError, ValueError):
+        return False
+    if os.name != "nt":
+        return True
+    return _enable_windows_vt(stream)
+
+def _enable_windows_vt(stream: Any) -> bool:
+    # Windows 10 and later interpret the sequences themselves once virtual terminal processing is switched on
+    try:
+        import ctypes
+        import msvcrt
+        kernel32 = ctypes.windll.kernel32
+        handle = msvcrt.get_osfhandle(stream.fileno())
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004)) # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except (AttributeError, ImportError, OSError, ValueError):
+        return False
+
+
+def detect_level(stream: Any) -> ColorLevel:
+    if os.environ.get("NO_COLOR"): # https://no-color.org
+        return ColorLevel.NONE
+    try:
+        tty = stream.isatty()
+    except (AttributeError, ValueError):
+        tty = False
+    term = os.environ.get("TERM", "").lower()
+    if not tty or term == "dumb":
+        return ColorLevel.NONE
+    if os.environ.get("COLORTERM", "").lower() in ("truecolor", "24bit"):
+        return ColorLevel.TRUECOLOR
+    if "256color" in term:
+        return ColorLevel.COLORS_256
+    if os.name == "nt" and supports_vt(stream):
+        return ColorLevel.TRUECOLOR # Every console with virtual terminal processing renders 24-bit colors
+    return ColorLevel.COLORS_16
+
+# The xterm defaults of the 16 basic colors, in SGR order: 30-37 and then the bright 90-97
+PALETTE_16: List[Tuple[int, int, int]] = [
+    (0, 0, 0), (205, 0, 0), (0, 205, 0), (205, 205, 0), (0, 0, 238), (205, 0, 205), (0, 205, 205), (229, 229, 229),
+    (127, 127, 127), (255, 0, 0), (0, 255, 0), (255, 255, 0), (92, 92, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255)
+]
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255) # The steps of the 6x6x6 cube at 16-231
+
+def _distance(a: Tuple[int, int, int], b: Tuple[int, int, int]) -> int:
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+def _cube_step(value: int) -> int:
+    return 0 if value < 48 else 1 if value < 115 else (value - 35) // 40
+
+def index_256(r: int, g: int, b: int) -> int:
+    steps = _cube_step(r), _cube_step(g), _cube_step(b)
+    cube = tuple(CUBE_LEVELS[step] for step in steps)
+    gray_step = min(23, max(0, (r + g + b) // 3 - 3) // 10) # The ramp at 232-255 runs from 8 to 238
+    gray = 8 + 10 * gray_step
+    if _distance((gray, gray, gray), (r, g, b)) < _distance(cube, (r, g, b)):
+        return 232 + gray_step
+    return 16 + 36 * steps[0] + 6 * steps[1] + steps[2]
+
+def index_16(r: int, g: int, b: int) -> int:
+    return min(range(16), key=lambda i: _distance(PALETTE_16[i], (r, g, b)))
+
+@lru_cache(maxsize=4096)
+def rgb(r: int, g: int, b: int, level: ColorLevel, background: bool = False) -> str:
+    # Quantized once per color and level, later lookups are a cache hit
+    if level == ColorLevel.NONE:
+        return ""
+    if level == ColorLevel.TRUECOLOR:
+        return f"\033[{48 if background else 38};2;{r};{g};{b}m"
+    if level == ColorLevel.COLORS_256:
+        return f"\033[{48 if background else 38};5;{index_256(r, g, b)}m"
+    index = index_16(r, g, b)
+    return f"\033[{(40 if background else 30) + index if index < 8 else (100 if background else 90) + index - 8}m"
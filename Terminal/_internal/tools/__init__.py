@@ -1,11 +1,30 @@
 """Terminal tools will provide seperate tools from the core functionality."""
 
-from .utils import Utils
-from .ansi_color import AnsiColor
-from .ansi_cursor import AnsiCursor
+import importlib
 
 __all__ = (
     "Utils",
     "AnsiColor",
     "AnsiCursor",
-)
\ No newline at end of file
+    "TaskRunner",
+    "Colorize",
+)
+
+# TaskRunner pulls in multiprocessing, so every tool is imported on first access
+_lazy = {
+    "Utils": ".utils",
+    "AnsiColor": ".ansi_color",
+    "AnsiCursor": ".ansi_cursor",
+    "TaskRunner": ".tasks",
+    "Colorize": ".colorize",
+}
+
+def __getattr__(name: str):
+    if name not in _lazy:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_lazy[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
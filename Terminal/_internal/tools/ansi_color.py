@@ -1,19 +1,21 @@
 from typing import Literal
+from ..core import Terminal
+from ..sgr import rgb
 
 __all__ = ("AnsiColor",)
 
 class AnsiColor:
     @classmethod
     def reset_all(cls) -> str:
-        return "\033[0m"
+        return "\033[0m" if Terminal.level() else ""
     
     @classmethod
     def foreground_rgb(cls, r: int, g: int, b: int) -> str:
-        return f"\033[38;2;{r};{g};{b}m"
+        return rgb(r, g, b, Terminal.level())
     
     @classmethod
     def background_rgb(cls, r: int, g: int, b: int) -> str:
-        return f"\033[48;2;{r};{g};{b}m"
+        return rgb(r, g, b, Terminal.level(), True)
     
     @classmethod
     def style(cls, n: Literal[1, 2, 4]) -> str:
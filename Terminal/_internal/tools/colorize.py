@@ -0,0 +1,161 @@
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+from ..core import Terminal
+from ..enums import ColorLevel
+from ..sgr import CUBE_LEVELS, PALETTE_16, index_256, index_16
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+__all__ = ("Colorize",)
+
+RGB = Tuple[int, int, int]
+
+class Colorize:
+    reset = "\033[0m"
+    # Escape strings are assembled from tables instead of being formatted per color
+    _digits = [str(i) for i in range(256)]
+    _table_256 = ([f"\033[38;5;{i}m" for i in range(256)], [f"\033[48;5;{i}m" for i in range(256)])
+    _table_16 = ([f"\033[{30 + i if i < 8 else 82 + i}m" for i in range(16)], [f"\033[{40 + i if i < 8 else 92 + i}m" for i in range(16)])
+
+    @classmethod
+    def text(
+        cls, 
+        text: str, 
+        colors: Any, 
+        *, 
+        background: bool = False, 
+        level: Optional[ColorLevel] = None
+    ) -> str:
+        if len(colors) != len(text):
+            raise ValueError(f"Expected one color per character, got {len(colors)} colors for {len(text)} characters.")
+        level = Terminal.level() if level is None else level
+        if not level or not text:
+            return text
+        starts, codes = cls._runs_numpy(colors, level) if np is not None else cls._runs(colors, level)
+        pieces = []
+        escape = cls._escaper(level, background)
+        for i, start in enumerate(starts):
+            pieces.append(escape(codes[i]))
+            pieces.append(text[start:starts[i + 1] if i + 1 < len(starts) else len(text)])
+        pieces.append(cls.reset)
+        return "".join(pieces)
+
+    @classmethod
+    def spans(
+        cls, 
+        text: str, 
+        spans: Iterable[Tuple[int, int, RGB]], 
+        *, 
+        background: bool = False, 
+        level: Optional[ColorLevel] = None
+    ) -> str:
+        level = Terminal.level() if level is None else level
+        if not level:
+            return text
+        escape = cls._escaper(level, background)
+        pieces, position, current = [], 0, None
+        for start, end, (r, g, b) in sorted(spans, key=lambda span: span[0]):
+            start = max(start, position)
+            if start >= end:
+                continue
+            if start > position and current is not None:
+                pieces.append(cls.reset) # The gap between two spans stays uncolored
+                current = None
+            pieces.append(text[position:start])
+            code = cls._code(r, g, b, level)
+            if code != current:
+                pieces.append(escape(code))
+                current = code
+            pieces.append(text[start:end])
+            position = end
+        if current is not None:
+            pieces.append(cls.reset)
+        pieces.append(text[position:])
+        return "".join(pieces)
+
+    @classmethod
+    def gradient(
+        cls, 
+        text: str, 
+        start: RGB, 
+        stop: RGB, 
+        *, 
+        background: bool = False, 
+        level: Optional[ColorLevel] = None
+    ) -> str:
+        return cls.text(text, cls.interpolate(start, stop, len(text)), background=background, level=level)
+
+    @staticmethod
+    def interpolate(start: RGB, stop: RGB, n: int) -> Any:
+        if np is not None:
+            steps = np.linspace(0.0, 1.0, n)[:, None]
+            return np.rint(np.asarray(start) + (np.asarray(stop) - np.asarray(start)) * steps).astype(np.int64)
+        last = max(n - 1, 1)
+        return [
+            tuple(round(a + (b - a) * i / last) for a, b in zip(start, stop)) 
+            for i in range(n)
+        ]
+
+    @classmethod
+    def _escaper(cls, level: ColorLevel, background: bool):
+        if level == ColorLevel.COLORS_256:
+            return cls._table_256[background].__getitem__
+        if level == ColorLevel.COLORS_16:
+            return cls._table_16[background].__getitem__
+        prefix, digits = "\033[48;2;" if background else "\033[38;2;", cls._digits
+        return lambda code: prefix + digits[code >> 16] + ";" + digits[code >> 8 & 255] + ";" + digits[code & 255] + "m"
+
+    @staticmethod
+    def _code(r: int, g: int, b: int, level: ColorLevel) -> int:
+        # The packed color for truecolor, otherwise the palette entry
+        if level == ColorLevel.COLORS_256:
+            return index_256(r, g, b)
+        if level == ColorLevel.COLORS_16:
+            return index_16(r, g, b)
+        return r << 16 | g << 8 | b
+
+    @classmethod
+    def _runs(cls, colors: Sequence[RGB], level: ColorLevel) -> Tuple[List[int], List[int]]:
+        starts, codes, known = [], [], {}
+        previous = None
+        for i, (r, g, b) in enumerate(colors):
+            key = r << 16 | g << 8 | b # Packed, so lists and other unhashable colors work as well
+            if key == previous:
+                continue
+            previous = key
+            code = known.get(key)
+            if code is None:
+                code = known[key] = cls._code(r, g, b, level)
+            if not codes or code != codes[-1]:
+                starts.append(i)
+                codes.append(code)
+        return starts, codes
+
+    @classmethod
+    def _runs_numpy(cls, colors: Any, level: ColorLevel) -> Tuple[List[int], List[int]]:
+        colors = np.asarray(colors, dtype=np.int64).reshape(-1, 3)
+        packed = colors[:, 0] << 16 | colors[:, 1] << 8 | colors[:, 2]
+        starts = np.concatenate(([0], np.flatnonzero(packed[1:] != packed[:-1]) + 1)) # Only where the color changes
+        # Quantized once per run, then runs that ended up on the same palette entry are merged
+        codes = cls._codes_numpy(colors[starts], level)
+        keep = np.concatenate(([True], codes[1:] != codes[:-1]))
+        return starts[keep].tolist(), codes[keep].tolist()
+
+    @staticmethod
+    def _codes_numpy(colors: Any, level: ColorLevel) -> Any:
+        if level == ColorLevel.COLORS_256:
+            steps = np.where(colors < 48, 0, np.where(colors < 115, 1, (colors - 35) // 40))
+            cube = np.asarray(CUBE_LEVELS)[steps]
+            gray_step = np.minimum(23, np.maximum(0, colors.sum(axis=1) // 3 - 3) // 10)
+            gray = 8 + 10 * gray_step
+            closer = ((gray[:, None] - colors) ** 2).sum(axis=1) < ((cube - colors) ** 2).sum(axis=1)
+            return np.where(closer, 232 + gray_step, 16 + 36 * steps[:, 0] + 6 * steps[:, 1] + steps[:, 2])
+        if level == ColorLevel.COLORS_16:
+            palette, codes = np.asarray(PALETTE_16), np.empty(len(colors), dtype=np.int64)
+            for start in range(0, len(colors), 1 << 14): # Blocks, so the distance matrix stays small
+                block = colors[start:start + (1 << 14)]
+                codes[start:start + len(block)] = ((block[:, None, :] - palette[None, :, :]) ** 2).sum(axis=2).argmin(axis=1)
+            return codes
+        return colors[:, 0] << 16 | colors[:, 1] << 8 | colors[:, 2]
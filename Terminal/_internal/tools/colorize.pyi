@@ -0,0 +1,58 @@
+from typing import Any, Iterable, Optional, Tuple
+from ..enums import ColorLevel
+
+RGB = Tuple[int, int, int]
+
+class Colorize:
+    """
+    Colors whole blocks of text at once, as for heatmaps, gradients and highlighted diffs. 
+    Uses NumPy when it is installed and plain Python otherwise. 
+    A sequence is only emitted where the color changes, after quantizing to the terminal's color level, 
+    and nothing at all at `ColorLevel.NONE`.
+    """
+    reset: str
+
+    @classmethod
+    def text(
+        cls, 
+        text: str, 
+        colors: Any, 
+        *, 
+        background: bool = False, 
+        level: Optional[ColorLevel] = None
+    ) -> str:
+        """
+        Color every character of `text` with its own rgb value. 
+        `colors` is a sequence of (r, g, b) or an array of shape (len(text), 3).
+        """
+        ...
+
+    @classmethod
+    def spans(
+        cls, 
+        text: str, 
+        spans: Iterable[Tuple[int, int, RGB]], 
+        *, 
+        background: bool = False, 
+        level: Optional[ColorLevel] = None
+    ) -> str:
+        """Color the (start, end, rgb) spans of `text`, leaving everything in between uncolored."""
+        ...
+
+    @classmethod
+    def gradient(
+        cls, 
+        text: str, 
+        start: RGB, 
+        stop: RGB, 
+        *, 
+        background: bool = False, 
+        level: Optional[ColorLevel] = None
+    ) -> str:
+        """Color `text` with a linear gradient from `start` to `stop`."""
+        ...
+
+    @staticmethod
+    def interpolate(start: RGB, stop: RGB, n: int) -> Any:
+        """`n` colors evenly spaced from `start` to `stop`."""
+        ...
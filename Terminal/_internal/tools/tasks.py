@@ -0,0 +1,106 @@
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor, wait
+from collections import deque
+from ..core import Terminal, Output
+from .ansi_cursor import AnsiCursor
+import multiprocessing
+import threading
+import queue
+import os
+
+__all__ = ("TaskRunner",)
+
+class Reporter:
+    def __init__(self, reports: Any, job: int) -> None:
+        self.reports = reports
+        self.job = job
+    
+    def __call__(self, done: float, total: float) -> None:
+        self.reports.put(((os.getpid(), threading.get_ident()), self.job, done, total))
+
+def _run_job(func: Callable[[Any, Reporter], Any], item: Any, reporter: Reporter) -> Any:
+    # Module level, so process pools can pickle it
+    reporter(0, 1)
+    try:
+        return func(item, reporter)
+    finally:
+        reporter(1, 1)
+
+class TaskRunner:
+    def __init__(
+        self, 
+        func: Callable[[Any, Reporter], Any], 
+        jobs: Iterable[Any], 
+        workers: int = 4, 
+        *, 
+        processes: bool = False, 
+        rate: float = 10, 
+        length: int = 30
+    ) -> None:
+        self.func = func
+        self.jobs = list(jobs)
+        self.workers = workers
+        self.processes = processes
+        self.rate = rate
+        self.bars = [
+            Terminal.ProgressBar("[has][need] [prog]%", "#", length, "-") for _ in range(workers)
+        ]
+        self.total = Terminal.ProgressBar("$gre[has]$res[need] [prog]%", "#", length, "-")
+        self.slots: Dict[Tuple[int, int], int] = {}
+        self.progress: List[Tuple[float, float]] = [(0, 1)] * workers
+        self.finished = deque() # Appending is atomic, so done-callbacks need no lock
+        self._drawn = 0
+        self._stop = threading.Event()
+        self._manager = None
+    
+    def run(self) -> List[Any]:
+        executor, reports = self._executor()
+        with executor:
+            futures = [
+                executor.submit(_run_job, self.func, item, Reporter(reports, i)) for i, item in enumerate(self.jobs)
+            ]
+            for future in futures:
+                future.add_done_callback(self.finished.append)
+            renderer = threading.Thread(target=self._render_loop, args=(reports,), name="Terminal.TaskRunner", daemon=True)
+            renderer.start()
+            wait(futures)
+            self._stop.set()
+            renderer.join()
+        self._drain(reports)
+        self._draw()
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+        return [future.result() for future in futures]
+    
+    def _executor(self) -> Tuple[Executor, Any]:
+        if self.processes:
+            # Plain queues cannot cross process boundaries, a manager queue can
+            self._manager = multiprocessing.Manager()
+            return ProcessPoolExecutor(self.workers), self._manager.Queue()
+        return ThreadPoolExecutor(self.workers), queue.SimpleQueue()
+    
+    def _render_loop(self, reports: Any) -> None:
+        while True:
+            self._drain(reports)
+            self._draw()
+            if self._stop.wait(1 / self.rate):
+                return
+    
+    def _drain(self, reports: Any) -> None:
+        while True:
+            try:
+                worker, _, done, total = reports.get_nowait()
+            except (queue.Empty, EOFError, OSError):
+                return
+            slot = self.slots.setdefault(worker, len(self.slots) % self.workers)
+            self.progress[slot] = (done, total)
+    
+    def _draw(self) -> None:
+        if Terminal.blocking: return
+        lines = [f"{i + 1:>3} " + bar.render(*self.progress[i]) for i, bar in enumerate(self.bars)]
+        lines.append("all " + self.total.render(len(self.finished), len(self.jobs)) + f" ({len(self.finished)}/{len(self.jobs)})")
+        out = AnsiCursor.cursor_up(self._drawn) if self._drawn else ""
+        out += "".join("\r" + AnsiCursor.erase_line() + line + "\n" for line in lines)
+        self._drawn = len(lines)
+        Output.write(out, flush=True)
@@ -0,0 +1,47 @@
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from collections import deque
+from ..core import Terminal
+
+class Reporter:
+    """Handed to each job. Call it with `(done, total)` to report progress."""
+    reports: Any
+    job: int
+
+    def __init__(self, reports: Any, job: int) -> None:
+        ...
+    
+    def __call__(self, done: float, total: float) -> None:
+        ...
+
+class TaskRunner:
+    """
+    Runs `func(job, report)` for every job on a thread or process pool.
+    One render thread draws a bar per worker and an aggregate bar in place, at most `rate` times a second.
+    Workers only put their progress on a queue, they never print.
+    """
+    func: Callable[[Any, Reporter], Any]
+    jobs: List[Any]
+    workers: int
+    processes: bool
+    rate: float
+    bars: List[Terminal.ProgressBar]
+    total: Terminal.ProgressBar
+    slots: Dict[Tuple[int, int], int]
+    progress: List[Tuple[float, float]]
+    finished: deque[Any]
+
+    def __init__(
+        self, 
+        func: Callable[[Any, Reporter], Any], 
+        jobs: Iterable[Any], 
+        workers: int = 4, 
+        *, 
+        processes: bool = False, 
+        rate: float = 10, 
+        length: int = 30
+    ) -> None:
+        ...
+    
+    def run(self) -> List[Any]:
+        """Run all jobs and return their results in order. Raises the first exception a job raised."""
+        ...
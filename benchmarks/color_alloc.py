@@ -0,0 +1,49 @@
+"""
+Allocations of styled cells: a grid of thousands of cells recolored every frame, 
+with a new Color per cell against the interned Terminal.rgb.
+
+Run from the repository root: python -m benchmarks.color_alloc
+"""
+
+import tracemalloc
+import time
+import sys
+
+import Terminal
+from Terminal._internal.sgr import rgb
+
+WIDTH, HEIGHT, FRAMES = 200, 50, 20
+
+def heat(x: int, y: int, frame: int) -> tuple:
+    v = (x * 7 + y * 13 + frame * 5) % 64 * 4
+    return v, 255 - v, 128
+
+def fresh(x: int, y: int, frame: int) -> Terminal.Terminal.Color:
+    return Terminal.Terminal.Color(rgb(*heat(x, y, frame), Terminal.Terminal.level()))
+
+def interned(x: int, y: int, frame: int) -> Terminal.Terminal.Color:
+    return Terminal.Terminal.rgb(*heat(x, y, frame))
+
+def build(make) -> list:
+    return [[[make(x, y, frame) for x in range(WIDTH)] for y in range(HEIGHT)] for frame in range(FRAMES)]
+
+def run(label: str, make) -> None:
+    started = time.perf_counter()
+    build(make)
+    elapsed = time.perf_counter() - started # Timed apart from tracemalloc, which slows every allocation down
+    tracemalloc.start()
+    frames = build(make)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    distinct = len({id(color) for grid in frames for row in grid for color in row})
+    print(f"{label:<22} {elapsed:>7.3f}s  {current / 1e6:>7.2f} MB held  {peak / 1e6:>7.2f} MB peak  {distinct:>8,} objects")
+
+def main() -> None:
+    Terminal.Terminal.color_level = Terminal.ColorLevel.TRUECOLOR
+    print(f"{WIDTH}x{HEIGHT} cells, {FRAMES} frames, {sys.getsizeof(Terminal.Terminal.Color('x'))} bytes per Color")
+    run("new Color per cell", fresh)
+    run("Terminal.rgb, interned", interned)
+    Terminal.Terminal.color_level = None
+
+if __name__ == "__main__":
+    main()
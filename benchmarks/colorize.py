@@ -0,0 +1,49 @@
+"""
+Colorizing a megabyte of text per character: one Terminal.rgb and concatenation per character against Colorize.
+
+Run from the repository root: python -m benchmarks.colorize
+"""
+
+import random
+import time
+
+import Terminal
+from Terminal._internal.tools import colorize
+
+SIZE = 1 << 20
+
+def per_character(text, colors, level) -> str:
+    Terminal.Terminal.color_level = level
+    out = ""
+    for character, (r, g, b) in zip(text, colors):
+        out += Terminal.Terminal.rgb(r, g, b).ansi + character
+    return out + "\033[0m"
+
+def bulk(text, colors, level) -> str:
+    return Terminal.Colorize.text(text, colors, level=level)
+
+def measure(label: str, func, *args) -> None:
+    started = time.perf_counter()
+    out = func(*args)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<34} {elapsed:>8.3f}s  {SIZE / elapsed / 1e6:>6.2f} MB/s  {len(out):>10,} chars out")
+
+def main() -> None:
+    random.seed(0)
+    text = "".join(random.choice("abcdefgh \n") for _ in range(SIZE))
+    gradient = [tuple(c) for c in Terminal.Colorize.interpolate((255, 0, 0), (0, 0, 255), SIZE)]
+    heatmap = [(v, 255 - v, 0) for v in (random.randrange(0, 256, 32) for _ in range(SIZE // 16)) for _ in range(16)]
+    numpy = colorize.np
+    for name, colors in (("gradient", gradient), ("heatmap", heatmap)):
+        for level in (Terminal.ColorLevel.TRUECOLOR, Terminal.ColorLevel.COLORS_256):
+            print(f"{name}, {level.name}")
+            measure("  per character", per_character, text, colors, level)
+            colorize.np = None
+            measure("  Colorize, pure Python", bulk, text, colors, level)
+            colorize.np = numpy
+            if numpy is not None:
+                measure("  Colorize, NumPy", bulk, text, numpy.asarray(colors), level)
+    Terminal.Terminal.color_level = None
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Throughput of Terminal.log from many producer threads, written directly or through the concurrent writer.
+
+Run from the repository root: python -m benchmarks.concurrent_output
+"""
+
+import threading
+import time
+import sys
+import os
+
+import Terminal
+
+LINES = 20000
+
+def run(producers: int, concurrent: bool) -> float:
+    Terminal.Terminal.configure(concurrent=concurrent)
+    per_thread = LINES // producers
+
+    def produce(n: int) -> None:
+        for i in range(per_thread):
+            Terminal.log("$redproducer", n, "line", i, "$res")
+
+    threads = [threading.Thread(target=produce, args=(n,)) for n in range(producers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    Terminal.Terminal.flush()
+    return per_thread * producers / (time.perf_counter() - started)
+
+def main() -> None:
+    stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+    results = [(producers, run(producers, False), run(producers, True)) for producers in (1, 8, 64)]
+    Terminal.Terminal.configure()
+    sys.stdout.close()
+    sys.stdout = stdout
+    print(f"{'producers':>9} {'direct lines/s':>15} {'concurrent lines/s':>19}")
+    for producers, direct, concurrent in results:
+        print(f"{producers:>9} {direct:>15,.0f} {concurrent:>19,.0f}")
+
+if __name__ == "__main__":
+    main()
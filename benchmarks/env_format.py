@@ -0,0 +1,31 @@
+"""
+Cost of Manager.format as the number of environments grows.
+
+Run from the repository root: python -m benchmarks.env_format
+"""
+
+import timeit
+
+import Terminal
+from Terminal._internal.core import Manager
+
+CALLS = 20000
+
+def run(environments: int, mode: Terminal.Mode, enabled: int) -> float:
+    manager = Manager()
+    manager.mode = mode
+    envs = [manager.new_env(Terminal.Terminal.Color("\033[31m"), Terminal.Terminal.Color("\033[0m")) for _ in range(environments)]
+    for env in envs[-enabled:]:
+        env.enable()
+    return timeit.timeit(lambda: manager.format("text"), number=CALLS) / CALLS * 1e9
+
+def main() -> None:
+    print(f"{'environments':>12} {'single':>12} {'multiple, 1 on':>16} {'multiple, all on':>18}")
+    for environments in (1, 10, 100, 1000, 10000):
+        single = run(environments, Terminal.Mode.SINGLE, environments)
+        multiple = run(environments, Terminal.Mode.MULTIPLE, 1)
+        stacked = run(environments, Terminal.Mode.MULTIPLE, environments)
+        print(f"{environments:>12} {single:>10.0f}ns {multiple:>14.0f}ns {stacked:>16.0f}ns")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Startup cost of the package: a fresh interpreter importing it, with and without the first output.
+
+Run from the repository root: python -m benchmarks.import_time
+"""
+
+import subprocess
+import statistics
+import time
+import sys
+
+RUNS = 20
+
+SCRIPTS = {
+    "interpreter only": "pass",
+    "import Terminal": "import Terminal",
+    "first print": "import Terminal; Terminal.print('$redline$res', color=True)",
+    "FileSystem access": "import Terminal; Terminal.FileSystem",
+    "Pages access": "import Terminal; Terminal.Pages",
+}
+
+def measure(script: str) -> float:
+    times = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", script], check=True, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - started)
+    return statistics.median(times) * 1e3
+
+def main() -> None:
+    measure("import Terminal") # Writes the bytecode caches, so the runs below only measure the import
+    for label, script in SCRIPTS.items():
+        print(f"{label:<20} {measure(script):>8.1f}ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Write throughput of colored lines through colorama's stream wrapper against the native backend.
+
+Run from the repository root: python -m benchmarks.output_backend
+Output goes to os.devnull, which colorama wraps to strip the sequences, as it does for pipes and files.
+"""
+
+import time
+import sys
+import os
+
+import Terminal
+from Terminal._internal.core import Config
+
+LINES = 50000
+
+def run(backend: str) -> float:
+    Terminal.Terminal.deinit()
+    Config.OUTPUT.BACKEND = backend
+    Config.OUTPUT.COLOR_LEVEL = Terminal.ColorLevel.TRUECOLOR # devnull is no terminal, but the sequences should still be written
+    Terminal.Terminal.init()
+    started = time.perf_counter()
+    for i in range(LINES):
+        Terminal.print("$redline$res", i, "$grewritten$res", color=True)
+    Terminal.Terminal.flush()
+    return time.perf_counter() - started
+
+def main() -> None:
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        Terminal.Terminal.configure(auto_deinit=False) # Switching backends deinitiates, so nothing is left for the exit
+        results = {backend: run(backend) for backend in ("colorama", "native")}
+        Terminal.Terminal.deinit()
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+    for backend, elapsed in results.items():
+        print(f"{backend:<10} {elapsed:>8.3f}s  {LINES / elapsed:>10,.0f} lines/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Inventory of a directory tree: recursive Directory loading against the parallel Scanner.
+
+Run from the repository root: python -m benchmarks.parallel_scan [path]
+Without a path, a temporary tree is generated.
+"""
+
+from pathlib import Path
+import tempfile
+import time
+import sys
+
+import Terminal
+
+def build_tree(root: Path, breadth: int = 8, depth: int = 3, files: int = 40) -> None:
+    level = [root]
+    for _ in range(depth):
+        level = [directory / f"dir{i}" for directory in level for i in range(breadth)]
+        for directory in level:
+            directory.mkdir(parents=True)
+            for i in range(files):
+                (directory / f"file{i}.txt").write_text("x" * i)
+
+def recursive(root: Path) -> int:
+    top = Terminal.FileSystem.Directory(root)
+    top.prefetch(None)
+    stack, total = [top], 0
+    while stack:
+        directory = stack.pop()
+        total += sum(file.size for file in directory.files)
+        stack.extend(directory.directories)
+    return total
+
+def parallel(root: Path, workers: int) -> int:
+    return Terminal.FileSystem.Scanner(workers).scan(root)[root].total_size
+
+def measure(label: str, func, *args) -> None:
+    started = time.perf_counter()
+    size = func(*args)
+    print(f"{label:<22} {time.perf_counter() - started:>8.3f}s  {size:,} bytes")
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as temporary:
+        root = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(temporary)
+        if len(sys.argv) <= 1:
+            build_tree(root)
+        measure("recursive Directory", recursive, root)
+        for workers in (1, 4, 16):
+            measure(f"Scanner ({workers} workers)", parallel, root, workers)
+
+if __name__ == "__main__":
+    main()